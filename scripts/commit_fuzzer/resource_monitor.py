@@ -4,89 +4,166 @@ Tracks CPU/RAM usage, kills runaway processes, and triggers graceful
 shutdown when memory becomes critically low.
 """
 
-import gc
+import ctypes
 import multiprocessing
 import os
 import psutil
-import shutil
+import re
+import signal
 import sys
-import threading
 import time
-from pathlib import Path
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Workers and the monitor rely on fork: they inherit the already-imported
+# fuzzer module, the test tuple and unpicklable state (threading.Event,
+# psutil handles) from the parent. Pin it so a different platform default
+# (e.g. forkserver) can't silently change that.
+MP_CONTEXT = multiprocessing.get_context('fork')
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+_MB = 1 << 20
+_GB = 1 << 30
+_MEMAVAILABLE_RE = re.compile(rb'MemAvailable:\s+(\d+) kB')
+# /proc/<pid>/task/<tid>/children needs CONFIG_PROC_CHILDREN.
+_HAS_TASK_CHILDREN = os.path.exists(f'/proc/self/task/{os.getpid()}/children')
 
 
 class ResourceMonitor:
+    STATUSES = ('normal', 'warning', 'critical')
+    CURRENT_TEST_MAX_BYTES = 256
+
     CONFIG = {
         'cpu_warning': 85.0,
         'cpu_critical': 95.0,
         'memory_warning_available_gb': 2.0,
         'memory_critical_available_gb': 0.5,
         'check_interval': 2,
+        'max_check_interval': 30,
         'pause_duration': 10,
         'max_process_memory_mb': 2048,
         'max_process_memory_mb_warning': 1536,
+        'psi_some_avg10_warning': 10.0,
+        'psi_full_avg10_critical': 5.0,
+        'monitor_niceness': 10,
     }
 
     def __init__(
         self,
         shutdown_event: multiprocessing.Event,
         stats: Dict,
-        bugs_folder: Path,
-        bug_patterns: List[str],
+        num_workers: int,
     ):
         self.shutdown_event = shutdown_event
         self.stats = stats
-        self.bugs_folder = bugs_folder
-        self.bug_patterns = bug_patterns
         self.workers: List = []
+        # The fuzzer's main process; the monitor itself runs in a child.
+        self._main_pid = os.getpid()
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        self._workers_key: Optional[tuple] = None
+        self._cached_worker_pids: Dict[int, int] = {}
 
-        _manager = multiprocessing.Manager()
-        self._state = _manager.dict({'status': 'normal', 'paused': False})
-        self._state_lock = multiprocessing.Lock()
-        self.current_tests = _manager.dict()
+        # Status and pause flag are written only by the monitor thread and
+        # polled by every worker, so plain shared ints are enough — no
+        # Manager round-trip or lock on the read path.
+        self._status = MP_CONTEXT.RawValue('i', 0)
+        self._paused = MP_CONTEXT.RawValue('b', 0)
+        # One fixed-size slot per worker (indexed by worker_id - 1) holding
+        # the test it is running; only read when reporting a killed process.
+        self._current_tests = [
+            MP_CONTEXT.RawArray(ctypes.c_char, self.CURRENT_TEST_MAX_BYTES)
+            for _ in range(num_workers)
+        ]
 
-    def start(self) -> threading.Thread:
-        thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        thread.start()
-        return thread
+    def start(self) -> multiprocessing.Process:
+        # Run in a separate process so /proc scanning never competes with
+        # the main process for the GIL. All state the workers read lives in
+        # shared memory, so nothing else changes for them.
+        proc = MP_CONTEXT.Process(target=self._run, daemon=True)
+        proc.start()
+        return proc
+
+    def _run(self):
+        # The parent owns signal handling and stops us via shutdown_event.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        self._monitor_loop()
 
     def check_state(self) -> str:
-        with self._state_lock:
-            return self._state.get('status', 'normal')
+        return self.STATUSES[self._status.value]
 
     def is_paused(self) -> bool:
-        with self._state_lock:
-            return self._state.get('paused', False)
+        return bool(self._paused.value)
+
+    def set_current_test(self, worker_id: int, test_name: Optional[str]):
+        encoded = test_name.encode()[:self.CURRENT_TEST_MAX_BYTES - 1] if test_name else b''
+        self._current_tests[worker_id - 1].value = encoded
+
+    def get_current_test(self, worker_id: int) -> Optional[str]:
+        if not 1 <= worker_id <= len(self._current_tests):
+            return None
+        value = self._current_tests[worker_id - 1].value
+        return value.decode(errors='replace') if value else None
 
     # ------------------------------------------------------------------
     # Internal loop
     # ------------------------------------------------------------------
 
     def _monitor_loop(self):
+        # Lower the monitor's priority so its scans yield to fuzzer workers.
+        try:
+            os.nice(self.CONFIG['monitor_niceness'])
+        except (AttributeError, OSError):
+            pass
+
+        # The kill scan runs every check_interval so runaway solvers are
+        # caught promptly. The system-wide sample (/proc/meminfo and PSI)
+        # backs off 1.5x per tick up to max_check_interval while status is
+        # normal with ample RAM headroom; ticks in between reuse the last
+        # sample.
+        idle_ticks = 0
+        next_sample = 0.0
+        memory_available_gb = 0.0
+        status = 'normal'
         while not self.shutdown_event.is_set():
             try:
                 try:
-                    cpu_percent = psutil.cpu_percent(interval=1, percpu=True)
-                    memory = psutil.virtual_memory()
-                    memory_available_gb = memory.available / (1024 ** 3)
-                    avg_cpu = sum(cpu_percent) / len(cpu_percent) if cpu_percent else 0.0
+                    now = time.monotonic()
+                    if now >= next_sample:
+                        memory_available_gb = self._mem_available_bytes() / _GB
+                        # PSI stall percentages catch reclaim thrashing that
+                        # MemAvailable alone can miss; (0, 0) without PSI support.
+                        psi_some, psi_full = self._read_psi_memory()
+                        psi_critical = psi_full > self.CONFIG['psi_full_avg10_critical']
+                        psi_warning = psi_some > self.CONFIG['psi_some_avg10_warning']
 
-                    status = 'normal'
-                    if memory_available_gb < self.CONFIG['memory_critical_available_gb']:
-                        status = 'critical'
-                    elif memory_available_gb < self.CONFIG['memory_warning_available_gb']:
-                        status = 'warning'
+                        status = 'normal'
+                        if memory_available_gb < self.CONFIG['memory_critical_available_gb'] or psi_critical:
+                            status = 'critical'
+                        elif memory_available_gb < self.CONFIG['memory_warning_available_gb'] or psi_warning:
+                            status = 'warning'
 
-                    with self._state_lock:
-                        self._state['status'] = status
+                        self._status.value = self.STATUSES.index(status)
+
+                        if (
+                            status == 'normal'
+                            and memory_available_gb >= 2 * self.CONFIG['memory_warning_available_gb']
+                        ):
+                            interval = min(
+                                self.CONFIG['max_check_interval'],
+                                self.CONFIG['check_interval'] * (1.5 ** idle_ticks),
+                            )
+                            idle_ticks += 1
+                        else:
+                            interval = self.CONFIG['check_interval']
+                            idle_ticks = 0
+                        next_sample = now + interval
 
                     threshold = (
                         self.CONFIG['max_process_memory_mb_warning']
                         if memory_available_gb < self.CONFIG['memory_warning_available_gb']
                         else self.CONFIG['max_process_memory_mb']
                     )
-                    self._kill_high_memory_processes(threshold)
+                    self._kill_high_memory_processes(threshold, memory_available_gb)
 
                     if status == 'critical':
                         self._handle_critical(memory_available_gb)
@@ -107,90 +184,224 @@ class ResourceMonitor:
             self._stop_and_report()
             return
 
-        with self._state_lock:
-            self._state['paused'] = True
-        try:
-            gc.collect()
-        except Exception:
-            pass
+        self._paused.value = 1
         time.sleep(self.CONFIG['pause_duration'])
-        with self._state_lock:
-            self._state['paused'] = False
+        self._paused.value = 0
 
     def _stop_and_report(self):
-        print("\n" + "=" * 60, file=sys.stderr)
-        print("CRITICAL RAM — STOPPING TO PRESERVE BUGS", file=sys.stderr)
-        print("=" * 60, file=sys.stderr)
-
-        subdirs = [self.bugs_folder] + [d for d in self.bugs_folder.iterdir() if d.is_dir()]
-        total_bugs = sum(len(self._collect(d)) for d in subdirs)
+        # Use the workers' running count rather than scanning bug dirs while
+        # memory is critically low.
+        total_bugs = self.stats['bugs_found'].value
 
-        print(f"  Total bugs found: {total_bugs}", file=sys.stderr)
-        print(f"  Tests processed: {self.stats.get('tests_processed', 0)}", file=sys.stderr)
-        print("Stopping fuzzer...", file=sys.stderr)
-        print("=" * 60 + "\n", file=sys.stderr)
+        sys.stderr.write(
+            "\n" + "=" * 60 + "\n"
+            "CRITICAL RAM — STOPPING TO PRESERVE BUGS\n"
+            + "=" * 60 + "\n"
+            f"  Total bugs found: {total_bugs}\n"
+            f"  Tests processed: {self.stats['tests_processed'].value}\n"
+            "Stopping fuzzer...\n"
+            + "=" * 60 + "\n\n"
+        )
+        sys.stderr.flush()
         self.shutdown_event.set()
 
-    def _collect(self, folder: Path) -> List[Path]:
-        if not folder.exists():
-            return []
-        return [f for pattern in self.bug_patterns for f in folder.glob(pattern)]
-
-    def _kill_high_memory_processes(self, threshold_mb: float):
+    def _kill_high_memory_processes(self, threshold_mb: float, memory_available_gb: float = 0.0):
         HIGH_MEMORY_REPORT_MB = 14336
         try:
-            main_pid = os.getpid()
-            worker_pids = {}
-            for worker_id, w in enumerate(self.workers, start=1):
-                try:
-                    worker_pids[w.pid] = worker_id
-                except (AttributeError, ValueError):
-                    pass
-
+            main_pid = self._main_pid
+            worker_pids = self._worker_pids()
             pid_to_worker: Dict = {}
             tracked_pids = {main_pid} | set(worker_pids)
+            # Solvers are descendants of the workers, so every pass checks
+            # them. With ample RAM left, and where the kernel lists each
+            # task's children, they are found from the tracked processes
+            # instead of by walking the whole /proc table.
+            if _HAS_TASK_CHILDREN and memory_available_gb > 2 * self.CONFIG['memory_warning_available_gb']:
+                children_map = self._task_children_map(tracked_pids)
+            else:
+                children_map = self._children_map()
             for pid in list(tracked_pids):
                 worker_id = worker_pids.get(pid)
-                descendants = self._descendants(pid)
+                descendants = self._descendants(pid, children_map)
                 tracked_pids.update(descendants)
                 if worker_id:
                     for d in descendants:
                         pid_to_worker[d] = worker_id
 
-            killed = 0
+            for pid in set(self._proc_cache) - tracked_pids:
+                del self._proc_cache[pid]
+
+            # Triage in integer bytes first; only offenders pay for float
+            # conversion and the psutil name/cmdline lookups below.
+            threshold_bytes = threshold_mb * _MB
+            offenders = []
             for pid in tracked_pids:
                 try:
-                    proc = psutil.Process(pid)
-                    rss_mb = proc.memory_info().rss / (1024 * 1024)
-                    if rss_mb <= threshold_mb:
-                        continue
-                    name = proc.name()
-                    cmdline = ' '.join(proc.cmdline()[:3])
-                    print(f"[RESOURCE] Killing {pid} ({name}) {rss_mb:.1f}MB > {threshold_mb}MB", file=sys.stderr)
-                    print(f"  Command: {cmdline}...", file=sys.stderr)
+                    rss = self._rss_bytes(pid)
+                except (OSError, ValueError, IndexError):
+                    self._proc_cache.pop(pid, None)
+                    continue
+                if rss > threshold_bytes:
+                    offenders.append((pid, rss / _MB))
+
+            killed = 0
+            out: List[str] = []
+            for pid, rss_mb in offenders:
+                try:
+                    proc = self._get_proc(pid)
+                    with proc.oneshot():
+                        name = proc.name()
+                        cmdline = ' '.join(proc.cmdline()[:3])
+                    out.append(f"[RESOURCE] Killing {pid} ({name}) {rss_mb:.1f}MB > {threshold_mb}MB\n")
+                    out.append(f"  Command: {cmdline}...\n")
                     if rss_mb >= HIGH_MEMORY_REPORT_MB:
                         wid = pid_to_worker.get(pid)
-                        test = self.current_tests.get(wid) if wid else None
+                        test = self.get_current_test(wid) if wid else None
                         msg = f"while processing: {test}" if test else "(test unknown)"
-                        print(f"  HIGH RAM: {rss_mb:.1f}MB {msg}", file=sys.stderr)
+                        out.append(f"  HIGH RAM: {rss_mb:.1f}MB {msg}\n")
                     proc.kill()
                     killed += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError, AttributeError):
+                except psutil.NoSuchProcess:
+                    self._proc_cache.pop(pid, None)
+                except (psutil.AccessDenied, KeyError, AttributeError):
                     pass
 
             if killed:
-                print(f"[RESOURCE] Killed {killed} process(es) > {threshold_mb}MB", file=sys.stderr)
+                out.append(f"[RESOURCE] Killed {killed} process(es) > {threshold_mb}MB\n")
+            if out:
+                sys.stderr.write(''.join(out))
+                sys.stderr.flush()
         except Exception as e:
             print(f"[WARN] Error killing high-RAM processes: {e}", file=sys.stderr)
 
-    def _descendants(self, pid: int):
-        result = set()
+    @staticmethod
+    def _mem_available_bytes() -> int:
+        """Read MemAvailable from /proc/meminfo, falling back to psutil off Linux."""
         try:
-            for child in psutil.Process(pid).children(recursive=True):
-                try:
-                    result.add(child.pid)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            fd = os.open('/proc/meminfo', os.O_RDONLY)
+            try:
+                match = _MEMAVAILABLE_RE.search(os.read(fd, 1024))
+            finally:
+                os.close(fd)
+            if match:
+                return int(match.group(1)) * 1024
+        except OSError:
             pass
+        return psutil.virtual_memory().available
+
+    @staticmethod
+    def _read_psi_memory() -> Tuple[float, float]:
+        """Return (some avg10, full avg10) from /proc/pressure/memory, or (0, 0)."""
+        try:
+            fd = os.open('/proc/pressure/memory', os.O_RDONLY)
+            try:
+                lines = os.read(fd, 256).split(b'\n')
+            finally:
+                os.close(fd)
+            some = float(lines[0].split()[1].split(b'=')[1])
+            full = float(lines[1].split()[1].split(b'=')[1]) if len(lines) > 1 and lines[1] else 0.0
+            return some, full
+        except (OSError, ValueError, IndexError):
+            return 0.0, 0.0
+
+    @staticmethod
+    def _rss_bytes(pid: int) -> int:
+        """Read RSS from /proc/<pid>/statm, far cheaper than memory_info()."""
+        fd = os.open(f'/proc/{pid}/statm', os.O_RDONLY)
+        try:
+            return int(os.read(fd, 128).split()[1]) * _PAGE_SIZE
+        finally:
+            os.close(fd)
+
+    def _worker_pids(self) -> Dict[int, int]:
+        """Return the worker pid → worker_id map, rebuilt only when workers change."""
+        key = tuple(getattr(w, 'pid', None) for w in self.workers)
+        if key != self._workers_key:
+            self._cached_worker_pids = {
+                pid: worker_id
+                for worker_id, pid in enumerate(key, start=1)
+                if pid is not None
+            }
+            self._workers_key = key
+        return self._cached_worker_pids
+
+    def _children_map(self) -> Dict[int, List[int]]:
+        """Snapshot the process table once as a ppid → [child pids] map.
+
+        Scans /proc directly and reads only the ppid field of each stat
+        file; falls back to psutil where /proc is unavailable.
+        """
+        children: Dict[int, List[int]] = {}
+        try:
+            entries = os.scandir('/proc')
+        except OSError:
+            for proc in psutil.process_iter(['pid', 'ppid']):
+                ppid = proc.info['ppid']
+                if ppid is not None:
+                    children.setdefault(ppid, []).append(proc.info['pid'])
+            return children
+
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    fd = os.open(f'/proc/{entry.name}/stat', os.O_RDONLY)
+                    try:
+                        data = os.read(fd, 512)
+                    finally:
+                        os.close(fd)
+                    # The comm field may contain spaces/parens; ppid is the
+                    # second field after the last ')'.
+                    ppid = int(data.rsplit(b')', 1)[1].split()[1])
+                except (OSError, ValueError, IndexError):
+                    continue
+                children.setdefault(ppid, []).append(int(entry.name))
+        return children
+
+    @staticmethod
+    def _task_children_map(roots) -> Dict[int, List[int]]:
+        """Build the ppid → [child pids] map for the trees under roots only.
+
+        Follows /proc/<pid>/task/<tid>/children from each root, so only
+        tracked processes are read rather than every process's stat file.
+        """
+        children: Dict[int, List[int]] = {}
+        queue = deque(roots)
+        while queue:
+            pid = queue.popleft()
+            if pid in children:
+                continue
+            kids: List[int] = []
+            try:
+                with os.scandir(f'/proc/{pid}/task') as tasks:
+                    for task in tasks:
+                        try:
+                            with open(f'{task.path}/children', 'rb') as f:
+                                kids.extend(int(c) for c in f.read().split())
+                        except (OSError, ValueError):
+                            continue
+            except OSError:
+                pass
+            children[pid] = kids
+            queue.extend(kids)
+        return children
+
+    def _descendants(self, pid: int, children_map: Dict[int, List[int]]):
+        result = set()
+        queue = deque(children_map.get(pid, ()))
+        while queue:
+            child = queue.popleft()
+            if child in result:
+                continue
+            result.add(child)
+            queue.extend(children_map.get(child, ()))
         return result
+
+    def _get_proc(self, pid: int) -> psutil.Process:
+        """Return a cached psutil.Process for pid, replacing it if the PID was reused."""
+        proc = self._proc_cache.get(pid)
+        if proc is None or not proc.is_running():
+            proc = psutil.Process(pid)
+            self._proc_cache[pid] = proc
+        return proc
@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 
 import argparse
+import errno
+import fnmatch
 import importlib
 import json
+import mmap
 import multiprocessing
+import multiprocessing.connection
+import os
+import re
 import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import psutil
 
@@ -19,7 +28,7 @@ _SCRIPTS_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_SCRIPTS_DIR))
 sys.path.insert(0, str(_SCRIPTS_DIR / "fuzzers"))
 
-from resource_monitor import ResourceMonitor
+from resource_monitor import MP_CONTEXT, ResourceMonitor
 from scheduling.config import (
     get_fuzzer_name,
     get_fuzzer_params,
@@ -28,11 +37,25 @@ from scheduling.config import (
 )
 
 
+def _available_cpus() -> int:
+    """CPUs this process may run on; respects cpuset limits, unlike cpu_count()."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return psutil.cpu_count() or 4
+
+
+# Set by a worker's signal handlers and read by its loop. A plain flag,
+# because the handlers must not take multiprocessing locks (shutdown_event,
+# stats counters) that the interrupted worker may be holding.
+_stop_requested = False
+
+
 class SimpleCommitFuzzer:
 
     def __init__(
         self,
-        tests: List[str],
+        tests: Sequence[str],
         tests_root: str,
         solver_name: str,
         oracle_name: str,
@@ -44,13 +67,17 @@ class SimpleCommitFuzzer:
         job_start_time: Optional[float] = None,
         stop_buffer_minutes: int = 5,
         job_id: Optional[str] = None,
+        pin_cores: bool = True,
+        per_test_timeout: Optional[float] = None,
     ):
-        self.tests = tests
+        self.tests = tuple(tests)
         self.tests_root = Path(tests_root)
         self.bugs_folder = Path(bugs_folder)
         self.fuzzer_params = fuzzer_params or {}
         self.job_id = job_id
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
+        self.per_test_timeout = per_test_timeout
 
         self.solver_name = solver_name
         self.oracle_name = oracle_name
@@ -60,6 +87,9 @@ class SimpleCommitFuzzer:
         self.oracle_config = get_solver_config(oracle_name)
 
         self.FuzzerClass = importlib.import_module(f"{fuzzer_name}.fuzzer").Fuzzer
+        self._bug_re = re.compile(
+            '|'.join(fnmatch.translate(p) for p in self.FuzzerClass.DEFAULT_BUG_PATTERNS)
+        )
 
         self.solver_binary = Path(self.solver_config["binary_path"])
         self.solver_flags = self.solver_config.get("solver_flags", "")
@@ -68,9 +98,14 @@ class SimpleCommitFuzzer:
         self.solver_cli = f"{self._resolve_binary(self.solver_name, self.solver_binary)} {self.solver_flags}".strip()
         self.oracle_cli = f"{self._resolve_binary(self.oracle_name, self.oracle_binary)} {self.oracle_flags}".strip()
         self.per_test_flags = self._load_per_test_flags()
+        self._per_test_solver_cli = {
+            test: f"{self.solver_cli} {' '.join(flags)}"
+            for test, flags in self.per_test_flags.items()
+            if flags
+        }
 
         try:
-            self.cpu_count = psutil.cpu_count()
+            self.cpu_count = _available_cpus()
         except Exception:
             self.cpu_count = 4
 
@@ -78,31 +113,46 @@ class SimpleCommitFuzzer:
         if num_workers > self.cpu_count:
             print(f"[WARN] Requested {num_workers} workers but only {self.cpu_count} CPU cores available, using {self.num_workers}", file=sys.stderr)
 
+        self._worker_cpu_map = self._build_worker_cpu_map() if pin_cores else {}
+
         if job_start_time is not None:
             self.time_remaining = self._compute_time_remaining(job_start_time, stop_buffer_minutes)
         elif time_remaining is not None:
             self.time_remaining = time_remaining
         else:
             self.time_remaining = None
+        # Monotonic deadline for the whole run; immune to wall-clock jumps.
+        self._deadline = (
+            self._start_monotonic + self.time_remaining if self.time_remaining is not None else None
+        )
 
         self._validate_solvers()
         self.bugs_folder.mkdir(parents=True, exist_ok=True)
 
-        self.test_queue = multiprocessing.Queue()
-        self.shutdown_event = multiprocessing.Event()
-        self.stats = multiprocessing.Manager().dict({
-            'tests_processed': 0,
-            'bugs_found': 0,
-            'tests_removed_unsupported': 0,
-            'tests_removed_timeout': 0,
-            'tests_requeued': 0,
-        })
+        # Tests are known up front and inherited by the forked workers, so
+        # dispatch only needs a shared cursor into self.tests.
+        self._test_cursor = MP_CONTEXT.Value('i', 0)
+        # Bug files already counted; each forked worker keeps its own copy.
+        self._seen_bug_files: set = set()
+        self._local_stats: Dict[str, int] = {}
+        self.shutdown_event = MP_CONTEXT.Event()
+        # Shared counters updated under each Value's own lock: atomic across
+        # workers and free of Manager round-trips.
+        self.stats = {
+            key: MP_CONTEXT.Value('Q', 0)
+            for key in (
+                'tests_processed',
+                'bugs_found',
+                'tests_removed_unsupported',
+                'tests_removed_timeout',
+                'tests_requeued',
+            )
+        }
 
         self.monitor = ResourceMonitor(
             shutdown_event=self.shutdown_event,
             stats=self.stats,
-            bugs_folder=self.bugs_folder,
-            bug_patterns=self.FuzzerClass.DEFAULT_BUG_PATTERNS,
+            num_workers=self.num_workers,
         )
 
     # ------------------------------------------------------------------
@@ -146,10 +196,7 @@ class SimpleCommitFuzzer:
 
     def _get_solver_cli_for_test(self, test_name: str) -> str:
         """Return solver CLI with per-test flags appended, if any."""
-        per_test_flags = self.per_test_flags.get(test_name, [])
-        if per_test_flags:
-            return f"{self.solver_cli} {' '.join(per_test_flags)}"
-        return self.solver_cli
+        return self._per_test_solver_cli.get(test_name, self.solver_cli)
 
     def _resolve_binary(self, name: str, binary: Path) -> str:
         if binary.exists():
@@ -174,17 +221,69 @@ class SimpleCommitFuzzer:
         return int(remaining)
 
     def _get_time_remaining(self) -> float:
-        if self.time_remaining is None:
+        if self._deadline is None:
             return float('inf')
-        return max(0.0, self.time_remaining - (time.time() - self.start_time))
+        return max(0.0, self._deadline - time.monotonic())
 
     def _is_time_expired(self) -> bool:
-        return self.time_remaining is not None and self._get_time_remaining() <= 0
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _test_timeout(self) -> Optional[float]:
+        """Timeout for one fuzzer run: the remaining job time, capped by per_test_timeout."""
+        timeout = None
+        if self.time_remaining:
+            remaining = self._get_time_remaining()
+            timeout = remaining if remaining > 0 else None
+        if self.per_test_timeout:
+            timeout = min(timeout, self.per_test_timeout) if timeout else self.per_test_timeout
+        return timeout
+
+    def _bump_stat(self, key: str, n: int = 1):
+        # Accumulated per worker and pushed to the shared counters by
+        # _flush_stats, so each test doesn't take the cross-process locks.
+        self._local_stats[key] = self._local_stats.get(key, 0) + n
+
+    def _flush_stats(self):
+        # Pop as we go, so a flush cut short by SIGTERM is not re-applied
+        # in full by the worker's final flush.
+        while self._local_stats:
+            key, n = self._local_stats.popitem()
+            if n:
+                counter = self.stats[key]
+                with counter.get_lock():
+                    counter.value += n
+
+    @staticmethod
+    def _install_worker_signal_handlers():
+        # The parent stops workers with SIGTERM once they miss the join
+        # timeout, possibly mid-test: unwind so the fuzzer run's cleanup
+        # still stops its children and the worker's finally flushes stats.
+        def _on_term(signum, frame):
+            global _stop_requested
+            _stop_requested = True
+            raise SystemExit(0)
+
+        # Ctrl-C reaches the whole process group. Stop after the current
+        # test instead of raising KeyboardInterrupt past the final flush.
+        # A handler rather than SIG_IGN, since an ignored SIGINT would be
+        # inherited by the solvers and keep them running.
+        def _on_int(signum, frame):
+            global _stop_requested
+            _stop_requested = True
+
+        signal.signal(signal.SIGTERM, _on_term)
+        signal.signal(signal.SIGINT, _on_int)
 
     def _collect_bug_files(self, folder: Path) -> List[Path]:
-        if not folder.exists():
+        try:
+            with os.scandir(folder) as entries:
+                return [
+                    Path(e.path)
+                    for e in entries
+                    if self._bug_re.match(e.name) and e.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
             return []
-        return [f for pattern in self.FuzzerClass.DEFAULT_BUG_PATTERNS for f in folder.glob(pattern)]
 
     # ------------------------------------------------------------------
     # Per-test execution
@@ -228,13 +327,18 @@ class SimpleCommitFuzzer:
         worker_id: int,
     ) -> str:
         if bug_found and bug_files:
-            print(f"[WORKER {worker_id}] Found {len(bug_files)} bug(s) on {test_name}")
-            self.stats['bugs_found'] += len(bug_files)
+            # Each worker's bug dir accumulates across runs, so count only
+            # files this worker has not reported before.
+            new_bugs = [f for f in bug_files if f not in self._seen_bug_files]
+            if new_bugs:
+                self._seen_bug_files.update(new_bugs)
+                print(f"[WORKER {worker_id}] Found {len(new_bugs)} bug(s) on {test_name}")
+                self._bump_stat('bugs_found', len(new_bugs))
             return exit_action
 
         if exit_action == 'remove':
             print(f"[WORKER {worker_id}] {test_name} — unsupported, removing")
-            self.stats['tests_removed_unsupported'] += 1
+            self._bump_stat('tests_removed_unsupported')
             return 'remove'
 
         if exit_action == 'requeue':
@@ -246,67 +350,148 @@ class SimpleCommitFuzzer:
     # Worker process
     # ------------------------------------------------------------------
 
-    def _process_one_test(self, test_name: str, worker_id: int):
+    def _claim_batch(self, n: int) -> Tuple[str, ...]:
+        """Atomically claim up to n unprocessed tests; empty once all are claimed."""
+        with self._test_cursor.get_lock():
+            start = self._test_cursor.value
+            end = min(start + n, len(self.tests))
+            self._test_cursor.value = end
+        return self.tests[start:end]
+
+    def _process_one_test(self, test_name: str, worker_id: int) -> bool:
+        """Run one test; return True if the worker should retry it later."""
         resource_status = self.monitor.check_state()
         if resource_status == 'warning':
             time.sleep(2)
         elif resource_status == 'critical':
-            try:
-                self.test_queue.put(test_name)
-            except Exception:
-                pass
             time.sleep(ResourceMonitor.CONFIG['pause_duration'])
-            return
+            return True
 
-        self.monitor.current_tests[worker_id] = test_name
-        time_remaining = self._get_time_remaining()
+        self.monitor.set_current_test(worker_id, test_name)
         bug_found, bug_files, runtime, exit_action = self._run_fuzzer(
             test_name,
             worker_id,
-            per_test_timeout=time_remaining if self.time_remaining and time_remaining > 0 else None,
+            per_test_timeout=self._test_timeout(),
         )
-        self.monitor.current_tests.pop(worker_id, None)
+        self.monitor.set_current_test(worker_id, None)
 
         action = self._handle_result(test_name, bug_found, bug_files, runtime, exit_action, worker_id)
+        self._bump_stat('tests_processed')
         if action == 'requeue':
+            self._bump_stat('tests_requeued')
+            return True
+        return False
+
+    def _build_worker_cpu_map(self) -> Dict[int, List[int]]:
+        """Split the allowed CPUs into one slice per worker.
+
+        When there are at least as many physical cores as workers, slices are
+        made of whole cores (hyperthread siblings together) so each worker
+        keeps its L1/L2 to itself; otherwise logical CPUs are split evenly.
+        """
+        if not hasattr(os, 'sched_getaffinity'):
+            return {}
+        cpus = sorted(os.sched_getaffinity(0))
+        cores: Dict[int, List[int]] = {}
+        for cpu in cpus:
             try:
-                self.test_queue.put(test_name)
-                self.stats['tests_requeued'] += 1
-            except Exception:
-                pass
-        self.stats['tests_processed'] += 1
+                siblings = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list").read_text()
+                core = int(re.split(r"[,-]", siblings.strip())[0])
+            except (OSError, ValueError):
+                core = cpu
+            cores.setdefault(core, []).append(cpu)
+
+        groups = sorted(cores.values()) if len(cores) >= self.num_workers else [[cpu] for cpu in cpus]
+        n, total = self.num_workers, len(groups)
+        cpu_map = {}
+        for i in range(n):
+            if total >= n:
+                # Proportional bounds spread the remainder, so no core is left idle.
+                chunk = groups[(i * total) // n:((i + 1) * total) // n]
+            else:
+                chunk = [groups[i % total]]
+            cpu_map[i + 1] = [cpu for group in chunk for cpu in group]
+        return cpu_map
+
+    def _pin_worker(self, worker_id: int):
+        """Pin this worker (and the solvers it spawns) to its own slice of CPUs."""
+        cpus = self._worker_cpu_map.get(worker_id)
+        if not cpus:
+            return
+        try:
+            os.sched_setaffinity(0, cpus)
+        except OSError as e:
+            print(f"[WORKER {worker_id}] Could not set CPU affinity: {e}", file=sys.stderr)
 
     def _worker_process(self, worker_id: int):
         print(f"[WORKER {worker_id}] Started")
+        self._install_worker_signal_handlers()
+        self._pin_worker(worker_id)
+        MAX_BATCH = 32
+        FAST_TEST_SECS = 2.0
+        SLOW_TEST_SECS = 30.0
+        EMA_ALPHA = 0.3
+        STATS_FLUSH_TESTS = 16
+        STATS_FLUSH_SECS = 5.0
+
+        # Tests are claimed in batches that grow while tests finish quickly
+        # and drop back to one when they run long, so slow tests don't
+        # strand a large claimed batch on one worker.
+        pending: deque = deque()
+        batch_size = 1
+        runtime_ema: Optional[float] = None
+        # Requeued tests stay with the worker that ran them and are cycled
+        # once the shared test list is exhausted.
+        requeued: deque = deque()
+        unflushed = 0
+        last_flush = time.monotonic()
 
-        while not self.shutdown_event.is_set():
-            try:
-                if self.monitor.is_paused():
-                    print(f"[WORKER {worker_id}] Paused due to {self.monitor.check_state()} resource usage", file=sys.stderr)
-                    time.sleep(ResourceMonitor.CONFIG['pause_duration'])
-                    continue
-
+        try:
+            while not _stop_requested and not self.shutdown_event.is_set():
                 try:
-                    test_name = self.test_queue.get(timeout=1.0)
-                except Exception:
-                    if self.shutdown_event.is_set() or self._is_time_expired():
-                        break
-                    continue
+                    if self.monitor.is_paused():
+                        print(f"[WORKER {worker_id}] Paused due to {self.monitor.check_state()} resource usage", file=sys.stderr)
+                        time.sleep(ResourceMonitor.CONFIG['pause_duration'])
+                        continue
 
-                if self._is_time_expired():
-                    try:
-                        self.test_queue.put(test_name)
-                    except Exception:
-                        pass
-                    break
+                    if self._is_time_expired():
+                        break
 
-                self._process_one_test(test_name, worker_id)
+                    if not pending:
+                        pending.extend(self._claim_batch(batch_size))
+                    if pending:
+                        test_name = pending.popleft()
+                    elif requeued:
+                        test_name = requeued.popleft()
+                    else:
+                        break
 
-            except Exception as e:
-                print(f"[WORKER {worker_id}] Error: {e}", file=sys.stderr)
-                continue
+                    started = time.monotonic()
+                    if self._process_one_test(test_name, worker_id):
+                        requeued.append(test_name)
+                    now = time.monotonic()
+                    elapsed = now - started
+
+                    unflushed += 1
+                    if unflushed >= STATS_FLUSH_TESTS or now - last_flush >= STATS_FLUSH_SECS:
+                        self._flush_stats()
+                        unflushed = 0
+                        last_flush = now
+
+                    runtime_ema = elapsed if runtime_ema is None else (
+                        EMA_ALPHA * elapsed + (1 - EMA_ALPHA) * runtime_ema
+                    )
+                    if runtime_ema < FAST_TEST_SECS:
+                        batch_size = min(MAX_BATCH, batch_size * 2)
+                    elif runtime_ema > SLOW_TEST_SECS:
+                        batch_size = 1
 
-        print(f"[WORKER {worker_id}] Stopped")
+                except Exception as e:
+                    print(f"[WORKER {worker_id}] Error: {e}", file=sys.stderr)
+                    continue
+        finally:
+            self._flush_stats()
+            print(f"[WORKER {worker_id}] Stopped")
 
     # ------------------------------------------------------------------
     # Main run loop
@@ -330,11 +515,8 @@ class SimpleCommitFuzzer:
         print(f"Workers: {self.num_workers} / {self.cpu_count} cores")
         print()
 
-        for test in self.tests:
-            self.test_queue.put(test)
-
         workers = [
-            multiprocessing.Process(target=self._worker_process, args=(wid,))
+            MP_CONTEXT.Process(target=self._worker_process, args=(wid,))
             for wid in range(1, self.num_workers + 1)
         ]
         for w in workers:
@@ -351,16 +533,18 @@ class SimpleCommitFuzzer:
         signal.signal(signal.SIGINT, _on_signal)
 
         try:
-            if self.time_remaining:
-                end_time = self.start_time + self.time_remaining
-                while time.time() < end_time and any(w.is_alive() for w in workers):
-                    time.sleep(1)
-                if time.time() >= end_time:
-                    print("Timeout reached, stopping workers...")
-                    self.shutdown_event.set()
-            else:
-                for w in workers:
-                    w.join()
+            # Block on the workers' sentinels until they exit or the deadline
+            # passes. Signal handlers only set shutdown_event; wait() resumes
+            # after EINTR on its own, so there is nothing to poll for.
+            end_time = self._deadline if self.time_remaining else None
+            pending = {w.sentinel for w in workers}
+            while pending and (end_time is None or time.monotonic() < end_time):
+                timeout = None if end_time is None else end_time - time.monotonic()
+                ready = multiprocessing.connection.wait(pending, timeout=timeout)
+                pending.difference_update(ready)
+            if end_time is not None and time.monotonic() >= end_time:
+                print("Timeout reached, stopping workers...")
+                self.shutdown_event.set()
         except KeyboardInterrupt:
             print("\nInterrupted, stopping workers...")
             self.shutdown_event.set()
@@ -370,37 +554,82 @@ class SimpleCommitFuzzer:
             if w.is_alive():
                 print(f"Warning: Worker {getattr(w, 'pid', '?')} did not terminate, killing...")
                 w.terminate()
-                w.join(timeout=2)
+                # SIGTERM unwinds the worker through the fuzzer run's own
+                # child shutdown before its final stats flush; allow for it.
+                w.join(timeout=2 + getattr(self.FuzzerClass, 'KILL_GRACE_SECS', 0))
                 if w.is_alive():
                     w.kill()
 
-        # Consolidate bugs from worker output dirs into bugs_folder
-        for subdir in sorted(self.bugs_folder.glob("*/")):
-            for bug_file in self._collect_bug_files(subdir):
+        # Consolidate bugs from worker output dirs into bugs_folder, tracking
+        # the final paths so the summary does not have to rescan the folder.
+        # Renames are metadata-bound, so subdirs are handled on a thread pool.
+        final_bugs = self._collect_bug_files(self.bugs_folder)
+        taken = {p.name for p in final_bugs}
+        lock = threading.Lock()
+        try:
+            with os.scandir(self.bugs_folder) as entries:
+                subdirs = sorted(Path(e.path) for e in entries if e.is_dir(follow_symlinks=False))
+        except FileNotFoundError:
+            subdirs = []
+        if subdirs:
+            with ThreadPoolExecutor(max_workers=min(32, self.num_workers, len(subdirs))) as ex:
+                for moved in ex.map(lambda d: self._consolidate_subdir(d, taken, lock), subdirs):
+                    final_bugs.extend(moved)
+
+        self._print_summary(final_bugs)
+
+    def _consolidate_subdir(self, subdir: Path, taken: set, lock: threading.Lock) -> List[Path]:
+        """Move one worker dir's bug files into bugs_folder, returning their new paths."""
+        moved = []
+        for bug_file in self._collect_bug_files(subdir):
+            dest = self.bugs_folder / bug_file.name
+            with lock:
+                if dest.name in taken:
+                    # Same-named bugs from several workers can land in the
+                    # same second, so the timestamp alone is not unique.
+                    ts = int(time.time())
+                    n = 0
+                    while dest.name in taken:
+                        dest = self.bugs_folder / f"{bug_file.stem}_{ts}_{n}{bug_file.suffix}"
+                        n += 1
+                taken.add(dest.name)
+            try:
                 try:
-                    dest = self.bugs_folder / bug_file.name
-                    if dest.exists():
-                        dest = self.bugs_folder / f"{bug_file.stem}_{int(time.time())}{bug_file.suffix}"
+                    os.rename(bug_file, dest)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
                     shutil.move(str(bug_file), str(dest))
-                except Exception:
-                    pass
-
-        self._print_summary()
-
-    def _print_summary(self):
+                moved.append(dest)
+            except Exception:
+                pass
+        return moved
+
+    @staticmethod
+    def _stream_file(path: Path):
+        """Copy a file's raw bytes to stdout via mmap, without decoding it."""
+        out = sys.stdout
+        out.flush()
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    out.buffer.write(m)
+        out.buffer.write(b"\n")
+        out.buffer.flush()
+
+    def _print_summary(self, bug_files: List[Path]):
         print()
         print("=" * 60)
         print(f"FINAL BUG SUMMARY{' FOR JOB ' + self.job_id if self.job_id else ''}")
         print("=" * 60)
 
-        bug_files = self._collect_bug_files(self.bugs_folder)
         if bug_files:
             print(f"\nFound {len(bug_files)} bug(s):")
             for i, bug_file in enumerate(bug_files, 1):
                 print(f"\nBug #{i}: {bug_file}")
                 print("-" * 60)
                 try:
-                    print(bug_file.read_text())
+                    self._stream_file(bug_file)
                 except Exception as e:
                     print(f"Error reading bug file: {e}")
                 print("-" * 60)
@@ -409,11 +638,11 @@ class SimpleCommitFuzzer:
 
         print()
         print("Statistics:")
-        print(f"  Tests processed:          {self.stats.get('tests_processed', 0)}")
-        print(f"  Bugs found:               {self.stats.get('bugs_found', 0)}")
-        print(f"  Tests requeued:           {self.stats.get('tests_requeued', 0)}")
-        print(f"  Tests removed (unsupported): {self.stats.get('tests_removed_unsupported', 0)}")
-        print(f"  Tests removed (timeout):  {self.stats.get('tests_removed_timeout', 0)}")
+        print(f"  Tests processed:          {self.stats['tests_processed'].value}")
+        print(f"  Bugs found:               {self.stats['bugs_found'].value}")
+        print(f"  Tests requeued:           {self.stats['tests_requeued'].value}")
+        print(f"  Tests removed (unsupported): {self.stats['tests_removed_unsupported'].value}")
+        print(f"  Tests removed (timeout):  {self.stats['tests_removed_timeout'].value}")
         print("=" * 60)
 
 
@@ -436,9 +665,13 @@ def main():
     parser.add_argument("--stop-buffer-minutes", type=int, default=5)
     parser.add_argument("--fuzzer-param", action="append", metavar="KEY=VALUE")
     parser.add_argument("--bugs-folder", default="bugs")
+    parser.add_argument("--per-test-timeout", type=float,
+                        help="Cap on a single fuzzer run in seconds (default: remaining job time)")
+    parser.add_argument("--no-pin-cores", dest="pin_cores", action="store_false",
+                        help="Do not pin workers to dedicated CPUs")
 
     try:
-        default_workers = psutil.cpu_count()
+        default_workers = _available_cpus()
     except Exception:
         default_workers = 4
     parser.add_argument("--workers", type=int, default=default_workers)
@@ -488,6 +721,8 @@ def main():
             job_start_time=args.job_start_time,
             stop_buffer_minutes=args.stop_buffer_minutes,
             job_id=args.job_id,
+            pin_cores=args.pin_cores,
+            per_test_timeout=args.per_test_timeout,
         ).run()
         sys.exit(0)
     except Exception as e:
@@ -12,7 +12,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scheduling"))
 from config import get_solver_config
-from coverage_mapper import CoverageMapper
+from coverage_mapper import CoverageMapper, read_git_head
 
 
 def count_tests(solver: str, build_dir: str = "build", test_dir: str = None,
@@ -46,18 +46,20 @@ def count_tests(solver: str, build_dir: str = "build", test_dir: str = None,
     else:
         repo_dir = Path(solver)
 
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print(f"Warning: Failed to get commit hash from {repo_dir}", file=sys.stderr)
-        commit_hash = "unknown"
+    commit_hash = read_git_head(repo_dir.resolve())
+    if commit_hash is None:
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            commit_hash = result.stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            print(f"Warning: Failed to get commit hash from {repo_dir}", file=sys.stderr)
+            commit_hash = "unknown"
 
     return {
         'test_count': len(tests),
@@ -9,16 +9,27 @@ Coverage mapper calls this script, runs the binary with per-entry flags,
 and captures gcov data.
 """
 
+import os
 import sys
 import json
 import subprocess
 import argparse
 import time
 import random
+import re
 import gc
-import psutil
+import multiprocessing
+import resource
+import tempfile
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import solver config
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scheduling"))
@@ -28,6 +39,49 @@ from config import get_solver_config
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
+def _json_dumps(obj) -> bytes:
+    """Compact JSON as UTF-8 bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def read_git_head(repo_dir: Path) -> Optional[str]:
+    """Resolve HEAD by reading the .git directory directly.
+
+    Returns None when the layout isn't a plain .git directory (worktrees,
+    submodules) or the ref can't be found, so the caller can fall back to git.
+    """
+    for candidate in (repo_dir, *repo_dir.parents):
+        git_dir = candidate / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+    if not git_dir.is_dir():
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[len("ref: "):]
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+        with open(git_dir / "packed-refs") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        pass
+    return None
+
+
 class CoverageMapper:
     # Paths that are never solver source — always excluded regardless of config
     SYSTEM_EXCLUDES = [
@@ -65,43 +119,49 @@ class CoverageMapper:
         # Source file filtering from config
         self.source_include = self.cov_config.get("source_include", ["src/"])
         self.source_exclude = self.cov_config.get("source_exclude", self.DEFAULT_SOURCE_EXCLUDE)
-
-        # Cache for demangled names
-        self.demangle_cache = {}
+        self._include_re = self._substring_regex(self.source_include)
+        self._exclude_re = self._substring_regex(self.SYSTEM_EXCLUDES + list(self.source_exclude))
+        # The same source files recur in every test's report
+        self._simplified_paths: Dict[str, str] = {}
+
+        # Optional redundancy pre-filter: once subsumption_window tests in a
+        # row from one directory add no new functions, the rest of that
+        # directory runs with fast_flags appended. Off unless both are set.
+        self.fast_flags = self.cov_config.get("fast_flags", [])
+        self.subsumption_window = self.cov_config.get("subsumption_window", 0)
+        self._covered_functions: set = set()
+        self._stale_runs: Dict[str, int] = {}
+        # Tests run with fast_flags; their coverage is partial, so it is not
+        # recorded in the mapping
+        self._fast_tests: set = set()
+
+        # .gcda locations, discovered on the first counter reset
+        self._gcda_paths: Optional[List[str]] = None
+        # Set in parallel workers: shadow tree the solver writes .gcda files into
+        self._gcov_prefix: Optional[str] = None
+        self._solver_env: Optional[Dict[str, str]] = None
         # Memory monitoring
         self.max_memory_mb = 10000  # 10GB limit
         self.memory_check_interval = 50
 
-    def demangle_function_name(self, mangled_name: str) -> str:
-        """Demangle C++ function names using c++filt with caching"""
-        if mangled_name in self.demangle_cache:
-            return self.demangle_cache[mangled_name]
-
-        try:
-            result = subprocess.run(['c++filt', mangled_name], capture_output=True, text=True)
-            demangled = result.stdout.strip() if result.returncode == 0 else mangled_name
-            self.demangle_cache[mangled_name] = demangled
-            return demangled
-        except FileNotFoundError:
-            self.demangle_cache[mangled_name] = mangled_name
-            return mangled_name
-
     def simplify_file_path(self, file_path: str) -> str:
         """Simplify file path to show only the relevant project path starting from source root."""
-        for pattern in self.source_include:
-            if pattern in file_path:
-                parts = file_path.split(pattern)
-                if len(parts) > 1:
-                    return pattern + parts[-1]
-        return file_path
+        simplified = self._simplified_paths.get(file_path)
+        if simplified is None:
+            simplified = file_path
+            for pattern in self.source_include:
+                # Cut at the last occurrence, as the previous split()[-1] did
+                idx = file_path.rfind(pattern)
+                if idx >= 0:
+                    simplified = file_path[idx:]
+                    break
+            self._simplified_paths[file_path] = simplified
+        return simplified
 
     def get_memory_usage_mb(self) -> float:
-        """Get current memory usage in MB"""
-        try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except Exception:
-            return 0.0
+        """Get peak memory usage (max RSS) of this process in MB"""
+        # Linux reports ru_maxrss in kB
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
     def check_memory_limit(self) -> bool:
         """Check if memory usage is within limits"""
@@ -112,15 +172,28 @@ class CoverageMapper:
         return True
 
     def cleanup_memory(self):
-        """Force garbage collection and clear caches"""
-        if len(self.demangle_cache) > 1000:
-            self.demangle_cache.clear()
+        """Force garbage collection"""
         gc.collect()
 
+    @staticmethod
+    def invert_test_stream(stream_file: Path) -> Dict[str, List[str]]:
+        """Build the function -> sorted unique tests mapping from a per-test JSONL stream."""
+        function_to_tests = defaultdict(set)
+        with open(stream_file, 'rb') as f:
+            for line in f:
+                record = _json_loads(line)
+                test_name = sys.intern(record["test"])
+                for func in record["functions"]:
+                    function_to_tests[sys.intern(func)].add(test_name)
+        # Sorted in place so serialization doesn't need a second dict
+        for func, tests in function_to_tests.items():
+            function_to_tests[func] = sorted(tests)
+        return function_to_tests
+
     def write_intermediate_mapping(self, function_to_tests: Dict, output_file: Path):
         """Write intermediate mapping to disk to save memory"""
-        with open(output_file, 'w') as f:
-            json.dump(function_to_tests, f, separators=(',', ':'))
+        with open(output_file, 'wb') as f:
+            f.write(_json_dumps(function_to_tests))
 
     # ── Test discovery ──────────────────────────────────────────────────
 
@@ -146,6 +219,50 @@ class CoverageMapper:
         test_subdir = self.cov_config.get("test_subdir", "")
         return solver_root / test_subdir if test_subdir else solver_root
 
+    @staticmethod
+    def _manifest_cache_key(script_path: Path, base_dir: Path) -> Optional[str]:
+        """Identify a manifest run by script version and test tree commit.
+
+        Returns None (no caching) when the test tree isn't a git checkout,
+        since then there is no cheap way to tell whether tests changed, or
+        when it has uncommitted changes, which HEAD alone doesn't capture.
+        """
+        head = read_git_head(base_dir.resolve())
+        if head is None:
+            return None
+        try:
+            status = subprocess.run(
+                ["git", "status", "--porcelain", "--", "."],
+                cwd=base_dir, capture_output=True, text=True, check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        if status.stdout.strip():
+            return None
+        st = script_path.stat()
+        return f"{script_path}:{st.st_mtime_ns}:{st.st_size}:{base_dir.resolve()}:{head}"
+
+    def _load_cached_manifest(self, cache_key: Optional[str]) -> Optional[List[Dict]]:
+        if cache_key is None:
+            return None
+        try:
+            with open(self.build_dir / ".test_discovery.json") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("key") != cache_key:
+            return None
+        return cached["entries"]
+
+    def _save_cached_manifest(self, cache_key: Optional[str], entries: List[Dict]):
+        if cache_key is None:
+            return
+        try:
+            with open(self.build_dir / ".test_discovery.json", 'w') as f:
+                json.dump({"key": cache_key, "entries": entries}, f, separators=(',', ':'))
+        except OSError:
+            pass
+
     def _get_manifest_tests(self) -> List[Tuple]:
         """Call the solver's manifest script to discover tests with per-entry flags."""
         manifest_script = self.cov_config.get("manifest_script")
@@ -161,21 +278,25 @@ class CoverageMapper:
             return []
 
         base_dir = self._resolve_manifest_base_dir()
+        cache_key = self._manifest_cache_key(script_path, base_dir)
+        entries = self._load_cached_manifest(cache_key)
 
-        try:
-            result = subprocess.run(
-                [sys.executable, str(script_path), str(base_dir)],
-                capture_output=True, text=True, check=True
-            )
-            entries = json.loads(result.stdout)
-        except subprocess.CalledProcessError as e:
-            print(f"Error running manifest script: {e.stderr}")
-            sys.stdout.flush()
-            return []
-        except json.JSONDecodeError as e:
-            print(f"Error parsing manifest script output: {e}")
-            sys.stdout.flush()
-            return []
+        if entries is None:
+            try:
+                result = subprocess.run(
+                    [sys.executable, str(script_path), str(base_dir)],
+                    capture_output=True, text=True, check=True
+                )
+                entries = json.loads(result.stdout)
+            except subprocess.CalledProcessError as e:
+                print(f"Error running manifest script: {e.stderr}")
+                sys.stdout.flush()
+                return []
+            except json.JSONDecodeError as e:
+                print(f"Error parsing manifest script output: {e}")
+                sys.stdout.flush()
+                return []
+            self._save_cached_manifest(cache_key, entries)
 
         tests = [(i + 1, entry["file"], entry["flags"]) for i, entry in enumerate(entries)]
         print(f"Found {len(tests)} manifest test entries")
@@ -200,8 +321,6 @@ class CoverageMapper:
             return None
 
         try:
-            for gcda in self.build_dir.rglob("*.gcda"):
-                gcda.unlink()
             self.reset_coverage_counters()
 
             # Resolve test file path — same logic as _get_manifest_tests base_dir
@@ -220,7 +339,7 @@ class CoverageMapper:
             start_time = time.time()
             try:
                 result = subprocess.run(
-                    cmd, cwd=self.build_dir,
+                    cmd, cwd=self.build_dir, env=self._solver_env,
                     capture_output=True, text=True, check=False,
                     timeout=self.test_timeout
                 )
@@ -236,7 +355,8 @@ class CoverageMapper:
                 sys.stdout.flush()
                 return None
 
-            coverage_data = self.extract_coverage_data(test_name)
+            # Counters were just zeroed, so no .gcda means nothing to report
+            coverage_data = self.extract_coverage_data(test_name) if self.has_coverage_data() else None
             if coverage_data:
                 print(f"  {test_name} - {len(coverage_data['functions'])} functions - {execution_time}s")
             else:
@@ -255,18 +375,21 @@ class CoverageMapper:
     def extract_coverage_data(self, test_name: str) -> Optional[Dict]:
         """Extract coverage data using fastcov"""
         safe_name = test_name.replace('/', '_').replace('\\', '_')
-        fastcov_output = self.build_dir / f"fastcov_{safe_name}.json"
+        fastcov_output = self.build_dir / f"fastcov_{safe_name}.info"
 
+        # Parallel workers already keep the cores busy, so their gcov runs stay serial
+        search_dir = self._gcov_prefix or str(self.build_dir)
+        jobs = "1" if self._gcov_prefix else "4"
         result = subprocess.run([
-            "fastcov", "--gcov", "gcov", "--search-directory", str(self.build_dir),
-            "--output", str(fastcov_output), "--exclude", "/usr/include/*",
-            "--exclude", "*/deps/*", "--jobs", "4"
+            "fastcov", "--gcov", "gcov", "--search-directory", search_dir,
+            "--lcov", "--output", str(fastcov_output), "--exclude", "/usr/include/*",
+            "--exclude", "*/deps/*", "--jobs", jobs
         ], cwd=self.build_dir.parent, capture_output=True, text=True, check=False)
 
         if result.returncode != 0:
             return None
 
-        result_data = self.parse_fastcov_json(fastcov_output, test_name)
+        result_data = self.parse_lcov_info(fastcov_output, test_name)
 
         try:
             fastcov_output.unlink()
@@ -275,24 +398,40 @@ class CoverageMapper:
 
         return result_data
 
-    def parse_fastcov_json(self, fastcov_file: Path, test_name: str) -> Optional[Dict]:
-        """Parse fastcov JSON file to extract function information"""
-        with open(fastcov_file, 'r') as f:
-            data = json.load(f)
+    def parse_lcov_info(self, lcov_file: Path, test_name: str) -> Optional[Dict]:
+        """Parse a fastcov lcov tracefile to extract executed functions.
 
+        Only SF/FN/FNDA/end_of_record lines are looked at, one line at a
+        time, so memory stays bounded by a single source file's functions.
+        """
+        # Ids keep the mangled name; join_coverage_mappings.py demangles the
+        # merged mapping once. They're built by concatenation: "<path>:" is
+        # computed once per source file and ":<line>" is kept as lcov gives it,
+        # then interned so one id is a single shared string across all tests.
         functions = set()
-
-        if 'sources' in data:
-            for file_path, file_data in data['sources'].items():
-                if self.is_source_file(file_path):
-                    if '' in file_data and 'functions' in file_data['']:
-                        for func_name, func_data in file_data['']['functions'].items():
-                            if func_data.get('execution_count', 0) > 0:
-                                demangled_name = self.demangle_function_name(func_name)
-                                simplified_path = self.simplify_file_path(file_path)
-                                line_num = func_data.get('start_line', 0)
-                                func_id = f"{simplified_path}:{demangled_name}:{line_num}"
-                                functions.add(func_id)
+        prefix = None
+        fn_lines: Dict[str, str] = {}
+        hit: List[str] = []
+        with open(lcov_file, 'r') as f:
+            for line in f:
+                if line.startswith('SF:'):
+                    file_path = line[3:].rstrip('\n')
+                    prefix = (self.simplify_file_path(file_path) + ':'
+                              if self.is_source_file(file_path) else None)
+                elif prefix is None:
+                    continue
+                elif line.startswith('FN:'):
+                    line_num, func_name = line[3:].rstrip('\n').split(',', 1)
+                    fn_lines[func_name] = ':' + line_num
+                elif line.startswith('FNDA:'):
+                    count, func_name = line[5:].rstrip('\n').split(',', 1)
+                    if count != '0':
+                        hit.append(func_name)
+                elif line.startswith('end_of_record'):
+                    functions.update(sys.intern(prefix + name + fn_lines.get(name, ':0')) for name in hit)
+                    prefix = None
+                    fn_lines.clear()
+                    hit.clear()
 
         if not functions:
             return None
@@ -302,87 +441,217 @@ class CoverageMapper:
             "functions": sorted(list(functions))
         }
 
+    @staticmethod
+    def _substring_regex(patterns: List[str]) -> "re.Pattern":
+        """One regex matching any of the given substrings; never matches if there are none."""
+        if not patterns:
+            return re.compile(r'(?!)')
+        return re.compile('|'.join(map(re.escape, patterns)))
+
     def is_source_file(self, file_path: str) -> bool:
         """Check if a file path belongs to the solver project source.
 
         Uses coverage.source_include (at least one must match) and
         coverage.source_exclude + SYSTEM_EXCLUDES (none must match).
         """
-        if not any(pattern in file_path for pattern in self.source_include):
-            return False
-        if any(pattern in file_path for pattern in self.SYSTEM_EXCLUDES):
-            return False
-        if any(pattern in file_path for pattern in self.source_exclude):
-            return False
-        return True
+        return (self._include_re.search(file_path) is not None
+                and self._exclude_re.search(file_path) is None)
+
+    def _find_gcda_paths(self) -> List[str]:
+        """Every path a .gcda file can appear at: next to each .gcno, plus any stray .gcda."""
+        paths = set()
+        for root, _, files in os.walk(self.build_dir):
+            for name in files:
+                if name.endswith(".gcno"):
+                    paths.add(os.path.join(root, name[:-len(".gcno")] + ".gcda"))
+                elif name.endswith(".gcda"):
+                    paths.add(os.path.join(root, name))
+        return sorted(paths)
+
+    def use_gcov_prefix(self, prefix: str):
+        """Redirect this process's solver runs into a private GCOV_PREFIX tree.
+
+        With GCOV_PREFIX_STRIP=0 each .gcda lands at prefix + its absolute
+        object path. The matching .gcno is symlinked next to it, which is
+        all gcov needs, so fastcov can read the shadow tree directly.
+        """
+        gcda_paths = []
+        for root, _, files in os.walk(os.path.abspath(self.build_dir)):
+            shadow_root = prefix + root
+            for name in files:
+                if name.endswith(".gcno"):
+                    os.makedirs(shadow_root, exist_ok=True)
+                    os.symlink(os.path.join(root, name), os.path.join(shadow_root, name))
+                    gcda_paths.append(os.path.join(shadow_root, name[:-len(".gcno")] + ".gcda"))
+        self._gcov_prefix = prefix
+        self._gcda_paths = gcda_paths
+        self._solver_env = {**os.environ, "GCOV_PREFIX": prefix, "GCOV_PREFIX_STRIP": "0"}
+
+    def has_coverage_data(self) -> bool:
+        """Whether any .gcda file exists, checking the cached locations only."""
+        if self._gcda_paths is None:
+            return True
+        return any(os.path.exists(path) for path in self._gcda_paths)
 
     def reset_coverage_counters(self):
-        """Reset coverage counters using fastcov --zerocounters"""
-        subprocess.run([
-            "fastcov", "--zerocounters", "--search-directory", str(self.build_dir),
-            "--exclude", "/usr/include/*", "--exclude", "*/deps/*"
-        ], cwd=self.build_dir.parent, capture_output=True, text=True, check=False)
+        """Reset coverage counters by deleting all .gcda files.
+
+        This is exactly what fastcov --zerocounters does, minus the process
+        start. The instrumented objects don't change between tests, so the
+        tree is walked once and later resets just unlink the cached paths.
+        """
+        if self._gcda_paths is None:
+            self._gcda_paths = self._find_gcda_paths()
+        for path in self._gcda_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
 
     # ── Test processing loop ────────────────────────────────────────────
 
-    def process_tests(self, tests: List[Tuple], max_runtime_seconds: int = None) -> str:
-        """Process tests sequentially with time guard and streaming to disk"""
-        print(f"Processing {len(tests)} tests")
-        print(f"Memory limit: {self.max_memory_mb}MB")
+    def _before_test(self, i: int, test_info: Tuple, total: int,
+                     job_start_time: float, max_runtime_seconds: Optional[int]) -> bool:
+        """Announce test i and apply the time and memory guards; False means stop."""
+        # Time guard: stop before hitting the job time limit
         if max_runtime_seconds:
-            print(f"Max runtime: {max_runtime_seconds // 60}m")
-        sys.stdout.flush()
-
-        job_start_time = time.time()
-        temp_file = self.build_dir / "coverage_temp.json"
-        function_to_tests = {}
+            elapsed = time.time() - job_start_time
+            if elapsed >= max_runtime_seconds:
+                print(f"Stopping at test {i}/{total} - reached time limit ({elapsed / 60:.0f}m)")
+                sys.stdout.flush()
+                return False
 
-        for i, test_info in enumerate(tests, 1):
-            # Time guard: stop before hitting the job time limit
-            if max_runtime_seconds:
-                elapsed = time.time() - job_start_time
-                if elapsed >= max_runtime_seconds:
-                    print(f"Stopping at test {i}/{len(tests)} - reached time limit ({elapsed / 60:.0f}m)")
-                    sys.stdout.flush()
-                    break
+        print(f"Test {i}/{total} (#{test_info[0]}): {test_info[1]}")
+        sys.stdout.flush()
 
-            test_id = test_info[0]
-            test_name = test_info[1]
-            print(f"Test {i}/{len(tests)} (#{test_id}): {test_name}")
+        if i % self.memory_check_interval == 0:
+            if not self.check_memory_limit():
+                print(f"Stopping at test {i} due to memory limit")
+                sys.stdout.flush()
+                return False
+            self.cleanup_memory()
+            memory_mb = self.get_memory_usage_mb()
+            print(f"Peak memory usage: {memory_mb:.1f}MB")
             sys.stdout.flush()
+        return True
 
-            if i % self.memory_check_interval == 0:
-                if not self.check_memory_limit():
-                    print(f"Stopping at test {i} due to memory limit")
-                    sys.stdout.flush()
-                    break
-                self.cleanup_memory()
-                memory_mb = self.get_memory_usage_mb()
-                print(f"Memory usage: {memory_mb:.1f}MB")
-                sys.stdout.flush()
+    def _apply_fast_flags(self, test_info: Tuple) -> Tuple:
+        """Append fast_flags to a test whose directory has stopped adding coverage."""
+        if not (self.fast_flags and self.subsumption_window):
+            return test_info
+        test_id, test_name, entry_flags = test_info
+        if self._stale_runs.get(os.path.dirname(test_name), 0) < self.subsumption_window:
+            return test_info
+        self._fast_tests.add(test_name)
+        return (test_id, test_name, entry_flags + self.fast_flags)
+
+    def _record_subsumption(self, result: Dict):
+        """Track, per test directory, how many tests in a row added no new functions."""
+        if not (self.fast_flags and self.subsumption_window):
+            return
+        directory = os.path.dirname(result["test_name"])
+        new_functions = [f for f in result["functions"] if f not in self._covered_functions]
+        if new_functions:
+            self._covered_functions.update(new_functions)
+            self._stale_runs[directory] = 0
+        else:
+            self._stale_runs[directory] = self._stale_runs.get(directory, 0) + 1
 
+    def _run_tests_sequential(self, tests: List[Tuple], job_start_time: float,
+                              max_runtime_seconds: Optional[int]) -> Iterator[Tuple[int, Optional[Dict]]]:
+        for i, test_info in enumerate(tests, 1):
+            if not self._before_test(i, test_info, len(tests), job_start_time, max_runtime_seconds):
+                break
             try:
-                result = self.process_single_test(test_info)
-                if result:
-                    test_name = result["test_name"]
-                    for func in result["functions"]:
-                        if func not in function_to_tests:
-                            function_to_tests[func] = []
-                        function_to_tests[func].append(test_name)
-
-                    if i % 100 == 0:
-                        self.write_intermediate_mapping(function_to_tests, temp_file)
+                yield i, self.process_single_test(self._apply_fast_flags(test_info))
             except Exception as e:
-                print(f"  {test_name} - unexpected error: {e} (skipping)")
+                print(f"  {test_info[1]} - unexpected error: {e} (skipping)")
                 sys.stdout.flush()
-                continue
 
-        self.write_intermediate_mapping(function_to_tests, temp_file)
+    def _run_tests_parallel(self, tests: List[Tuple], workers: int, job_start_time: float,
+                            max_runtime_seconds: Optional[int]) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Run tests on forked workers, each isolated by its own GCOV_PREFIX.
+
+        Tests are submitted a few at a time so the time and memory guards
+        still stop new work promptly.
+        """
+        with tempfile.TemporaryDirectory(prefix="cov_workers_") as prefix_root:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_coverage_worker,
+                initargs=(self, prefix_root),
+            ) as pool:
+                pending_tests = enumerate(tests, 1)
+                in_flight = {}
+                submitting = True
+                while True:
+                    while submitting and len(in_flight) < 2 * workers:
+                        i, test_info = next(pending_tests, (None, None))
+                        if test_info is None or not self._before_test(
+                                i, test_info, len(tests), job_start_time, max_runtime_seconds):
+                            submitting = False
+                            break
+                        future = pool.submit(_process_test_in_worker, self._apply_fast_flags(test_info))
+                        in_flight[future] = (i, test_info)
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i, test_info = in_flight.pop(future)
+                        try:
+                            yield i, future.result()
+                        except Exception as e:
+                            print(f"  {test_info[1]} - unexpected error: {e} (skipping)")
+                            sys.stdout.flush()
+
+    def process_tests(self, tests: List[Tuple], max_runtime_seconds: int = None,
+                      workers: int = 1) -> str:
+        """Process tests with time guard and streaming to disk.
+
+        With workers > 1 tests run concurrently in forked processes, each
+        writing its .gcda files into a private GCOV_PREFIX tree.
+        """
+        print(f"Processing {len(tests)} tests")
+        print(f"Memory limit: {self.max_memory_mb}MB")
+        if max_runtime_seconds:
+            print(f"Max runtime: {max_runtime_seconds // 60}m")
+        if workers > 1:
+            print(f"Workers: {workers}")
+        sys.stdout.flush()
+
+        job_start_time = time.time()
+        temp_file = self.build_dir / "coverage_temp.json"
+        stream_file = self.build_dir / "coverage_temp.jsonl"
+
+        if workers > 1:
+            results = self._run_tests_parallel(tests, workers, job_start_time, max_runtime_seconds)
+        else:
+            results = self._run_tests_sequential(tests, job_start_time, max_runtime_seconds)
+
+        # Each result is appended as one JSONL line as it arrives; the
+        # function -> tests inversion happens once at the end
+        fast_runs = 0
+        with open(stream_file, 'wb') as stream:
+            for _, result in results:
+                if result and result["test_name"] in self._fast_tests:
+                    fast_runs += 1
+                elif result:
+                    self._record_subsumption(result)
+                    stream.write(_json_dumps({"test": result["test_name"], "functions": result["functions"]}))
+                    stream.write(b'\n')
+                    stream.flush()
+
+        if fast_runs:
+            print(f"{fast_runs} test(s) ran with fast_flags; their coverage is not recorded")
+            sys.stdout.flush()
+        self.write_intermediate_mapping(self.invert_test_stream(stream_file), temp_file)
+        stream_file.unlink()
         return str(temp_file)
 
     def run(self, max_tests: int = None, test_pattern: str = None,
             start_index: int = None, end_index: int = None,
-            max_runtime_minutes: int = None):
+            max_runtime_minutes: int = None, workers: int = 1):
         """Main execution method"""
         print(f"Discovering {self.solver} tests (type: {self.test_type})...")
         sys.stdout.flush()
@@ -416,7 +685,7 @@ class CoverageMapper:
             sys.stdout.flush()
 
         max_runtime_seconds = max_runtime_minutes * 60 if max_runtime_minutes else None
-        temp_file = self.process_tests(tests, max_runtime_seconds=max_runtime_seconds)
+        temp_file = self.process_tests(tests, max_runtime_seconds=max_runtime_seconds, workers=workers)
 
         if not temp_file or not Path(temp_file).exists():
             print("No coverage data generated")
@@ -426,8 +695,8 @@ class CoverageMapper:
         output_file = f"coverage_mapping_{start_index}_{end_index}.json" if start_index is not None else "coverage_mapping.json"
         Path(temp_file).rename(output_file)
 
-        with open(output_file, 'r') as f:
-            coverage_mapping = json.load(f)
+        with open(output_file, 'rb') as f:
+            coverage_mapping = _json_loads(f.read())
 
         print(f"Coverage mapping saved to {output_file}")
         print(f"Total functions: {len(coverage_mapping)}")
@@ -435,6 +704,20 @@ class CoverageMapper:
         sys.stdout.flush()
 
 
+# Per-process mapper for parallel workers; set by _init_coverage_worker after fork
+_worker_mapper: Optional[CoverageMapper] = None
+
+
+def _init_coverage_worker(mapper: CoverageMapper, prefix_root: str):
+    global _worker_mapper
+    _worker_mapper = mapper
+    mapper.use_gcov_prefix(tempfile.mkdtemp(dir=prefix_root))
+
+
+def _process_test_in_worker(test_info: Tuple) -> Optional[Dict]:
+    return _worker_mapper.process_single_test(test_info)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Unified Coverage Mapper')
     parser.add_argument('--solver', required=True, help='Solver name (reads config from solver.json)')
@@ -446,6 +729,8 @@ def main():
     parser.add_argument('--end-index', type=int, help='End index for test range (1-based, inclusive)')
     parser.add_argument('--max-runtime', type=int, default=350,
                         help='Max runtime in minutes before stopping gracefully (default: 350 = 5h50m)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Tests to run concurrently, each worker in its own GCOV_PREFIX tree (default: 1)')
 
     args = parser.parse_args()
 
@@ -453,7 +738,7 @@ def main():
         mapper = CoverageMapper(args.solver, args.build_dir, args.test_dir)
         mapper.run(max_tests=args.max_tests, test_pattern=args.test_pattern,
                    start_index=args.start_index, end_index=args.end_index,
-                   max_runtime_minutes=args.max_runtime)
+                   max_runtime_minutes=args.max_runtime, workers=args.workers)
     except KeyboardInterrupt:
         print("\nInterrupted by user")
         sys.stdout.flush()
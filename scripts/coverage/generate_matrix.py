@@ -21,6 +21,19 @@ def filter_tests(tests: list, skip_tests: set) -> list:
     return filtered
 
 
+def partition_tests(total_tests: int, target_jobs: int) -> list:
+    """Split 1..total_tests into contiguous (start_index, end_index) ranges, one per job.
+
+    The job count is derived from the rounded-up chunk size, so no job is
+    left with an empty range when total_tests doesn't divide evenly.
+    """
+    tests_per_job = math.ceil(total_tests / min(target_jobs, total_tests))
+    return [
+        (start, min(start + tests_per_job - 1, total_tests))
+        for start in range(1, total_tests + 1, tests_per_job)
+    ]
+
+
 def generate_matrix(solver: str, build_dir: str = "build", test_dir: str = None,
                     target_jobs: int = None):
     """Generate dynamic matrix for coverage mapping jobs."""
@@ -48,21 +61,17 @@ def generate_matrix(solver: str, build_dir: str = "build", test_dir: str = None,
         tests = all_tests
 
     total_tests = len(tests)
-    total_jobs = min(target_jobs, total_tests)
-    tests_per_job = math.ceil(total_tests / total_jobs)
+    ranges = partition_tests(total_tests, target_jobs)
+    total_jobs = len(ranges)
+    tests_per_job = ranges[0][1] - ranges[0][0] + 1
 
     print(f"Found {total_tests} tests", file=sys.stderr)
     print(f"Total jobs: {total_jobs}, Tests per job: {tests_per_job}", file=sys.stderr)
 
-    matrix_entries = []
-    for job_id in range(1, total_jobs + 1):
-        start_index = (job_id - 1) * tests_per_job + 1
-        end_index = min(job_id * tests_per_job, total_tests)
-        matrix_entries.append({
-            'job_name': f"{solver}-part{job_id}",
-            'start_index': start_index,
-            'end_index': end_index
-        })
+    matrix_entries = [
+        {'job_name': f"{solver}-part{job_id}", 'start_index': start_index, 'end_index': end_index}
+        for job_id, (start_index, end_index) in enumerate(ranges, 1)
+    ]
 
     return {
         'matrix': {'include': matrix_entries},
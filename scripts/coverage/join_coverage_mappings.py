@@ -5,8 +5,46 @@ Simple script to join coverage mapping files.
 
 import json
 import os
+import subprocess
 import sys
 
+
+def demangle_function_ids(mapping: dict) -> dict:
+    """Rewrite "path:mangled:line" keys to "path:demangled:line".
+
+    All unique names go through a single c++filt run. Distinct symbols that
+    demangle to the same id (e.g. complete/base constructors) are merged.
+    """
+    parts = {}
+    for func_id in mapping:
+        path, rest = func_id.split(':', 1)
+        name, line = rest.rsplit(':', 1)
+        parts[func_id] = (path, name, line)
+
+    names = sorted({name for _, name, _ in parts.values()})
+    demangled = dict(zip(names, names))
+    try:
+        result = subprocess.run(['c++filt'], input='\n'.join(names) + '\n',
+                                capture_output=True, text=True)
+        lines = result.stdout.splitlines()
+        if result.returncode == 0 and len(lines) == len(names):
+            demangled = dict(zip(names, lines))
+        else:
+            print("Warning: c++filt failed, keeping mangled names", file=sys.stderr)
+    except FileNotFoundError:
+        print("Warning: c++filt not found, keeping mangled names", file=sys.stderr)
+
+    result_mapping = {}
+    for func_id, tests in mapping.items():
+        path, name, line = parts[func_id]
+        result_mapping.setdefault(f"{path}:{demangled[name]}:{line}", set()).update(tests)
+    merged = len(mapping) - len(result_mapping)
+    if merged:
+        print(f"Note: {merged} function id(s) merged into an id with the same demangled name",
+              file=sys.stderr)
+    return result_mapping
+
+
 def main():
     # Find all coverage mapping files
     mapping_files = []
@@ -32,9 +70,11 @@ def main():
                     merged_mapping[func] = []
                 merged_mapping[func].extend(tests)
 
-    # Remove duplicates and sort
+    # Per-job mappings keep mangled names; demangle once here, then
+    # remove duplicates and sort
+    merged_mapping = demangle_function_ids(merged_mapping)
     for func in merged_mapping:
-        merged_mapping[func] = sorted(list(set(merged_mapping[func])))
+        merged_mapping[func] = sorted(merged_mapping[func])
 
     # Save merged mapping
     with open('coverage_mapping.json', 'w') as f:
@@ -1,14 +1,61 @@
 """Typefuzz (yinyang) fuzzer — type-aware SMT formula mutation."""
 
+import fnmatch
+import functools
+import itertools
+import os
+import re
 import shutil
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
+_stale_seq = itertools.count()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    return shutil.which(name) or name
+
+
+_PLACEHOLDER_RE = re.compile(r"^\{(\w+)\}$")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_command(template: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[Tuple[int, str, bool], ...]]:
+    """Split a command template into its static tokens and the slots to fill.
+
+    Each slot is (index, key_or_token, is_key): whole-token placeholders are
+    looked up directly, anything else with braces goes through format_map.
+    """
+    slots = []
+    for i, token in enumerate(template):
+        m = _PLACEHOLDER_RE.match(token)
+        if m:
+            slots.append((i, m.group(1), True))
+        elif "{" in token:
+            slots.append((i, token, False))
+    return template, tuple(slots)
+
+
+@functools.lru_cache(maxsize=None)
+def _bug_name_re(patterns: Tuple[str, ...]) -> "re.Pattern":
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+def _render_command(template: Tuple[str, ...], ctx: Dict) -> List[str]:
+    static, slots = _compile_command(template)
+    cmd = list(static)
+    for i, value, is_key in slots:
+        cmd[i] = str(ctx[value]) if is_key else value.format_map(ctx)
+    return cmd
+
+
 class Fuzzer:
-    DEFAULT_PARAMS = {"iterations": 250, "modulo": 2, "timeout": 120}
+    DEFAULT_PARAMS = {"iterations": 250, "modulo": 2, "timeout": 120, "instances": 1}
     DEFAULT_COMMAND = [
         "typefuzz",
         "-i", "{iterations}",
@@ -21,11 +68,11 @@ class Fuzzer:
         "{seed_path}",
     ]
     DEFAULT_EXIT_CODES = {
-        "10": {"bug_found": True,  "action": "requeue"},
-        "3":  {"bug_found": False, "action": "remove"},
-        "0":  {"bug_found": False, "action": "requeue"},
+        10: (True,  "requeue"),
+        3:  (False, "remove"),
+        0:  (False, "requeue"),
     }
-    DEFAULT_EXIT_ACTION = {"bug_found": False, "action": "continue"}
+    DEFAULT_EXIT_ACTION = (False, "continue")
     DEFAULT_DIRS = {
         "bugs_dir":    {"path": "bugs/worker_{worker_id}", "type": "output"},
         "scratch_dir": {"path": "scratch_{worker_id}",     "type": "temp"},
@@ -33,6 +80,7 @@ class Fuzzer:
     }
     DEFAULT_BUG_PATTERNS = ["*.smt2", "*.smt"]
     DEFAULT_SOLVER_CLIS_SEPARATOR = ";"
+    KILL_GRACE_SECS = 5.0
 
     def __init__(
         self,
@@ -43,13 +91,9 @@ class Fuzzer:
         params_override: Optional[Dict] = None,
     ):
         params = {**self.DEFAULT_PARAMS, **(params_override or {})}
+        instances = max(1, int(params.pop("instances")))
 
-        self.dirs = {
-            name: {"path": Path(cfg["path"].format(worker_id=worker_id)), "type": cfg["type"]}
-            for name, cfg in self.DEFAULT_DIRS.items()
-        }
-
-        ctx = {
+        base_ctx = {
             **params,
             "seed_path": seed_path,
             "solver_cli": solver_cli,
@@ -57,38 +101,128 @@ class Fuzzer:
             "solver_clis": self.DEFAULT_SOLVER_CLIS_SEPARATOR.join([solver_cli, oracle_cli]),
             "worker_id": str(worker_id),
         }
-        ctx.update({name: str(info["path"]) for name, info in self.dirs.items()})
-        self.cmd = [token.format_map(ctx) for token in self.DEFAULT_COMMAND]
 
-        for info in self.dirs.values():
-            info["path"].mkdir(parents=True, exist_ok=True)
+        # With instances > 1, several typefuzz processes mutate the same seed
+        # concurrently, each with its own bugs/scratch/log dirs so they never
+        # write to the same files. Paths stay plain strings; collect() builds
+        # Path objects only for the bug files it returns.
+        self.dirs: Dict[str, Dict] = {}
+        self.cmds: List[List[str]] = []
+        for i in range(instances):
+            suffix = f"_{i}" if instances > 1 else ""
+            paths = {
+                name: cfg["path"].format(worker_id=worker_id) + suffix
+                for name, cfg in self.DEFAULT_DIRS.items()
+            }
+            for name, path in paths.items():
+                self.dirs[name + suffix] = {"path": path, "type": self.DEFAULT_DIRS[name]["type"]}
+            ctx = {**base_ctx, **paths}
+            cmd = _render_command(tuple(self.DEFAULT_COMMAND), ctx)
+            # An absolute executable path lets subprocess use posix_spawn.
+            cmd[0] = _resolve_executable(cmd[0])
+            self.cmds.append(cmd)
+        self.cmd = self.cmds[0]
+        self._dirs_created = False
+        self._output_mtimes: Dict[str, int] = {}
+
+    def _ensure_dirs(self):
+        # Created on first execute(), so a Fuzzer used only for parse_result
+        # touches no files.
+        if not self._dirs_created:
+            for info in self.dirs.values():
+                os.makedirs(info["path"], exist_ok=True)
+            self._dirs_created = True
 
     def execute(self, timeout: Optional[float] = None) -> Tuple[int, float]:
         start = time.time()
+        deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+        procs: List[subprocess.Popen] = []
         try:
-            kwargs: Dict = {"capture_output": True, "text": True}
-            if timeout and timeout > 0:
-                kwargs["timeout"] = timeout
-            result = subprocess.run(self.cmd, **kwargs)
-            return result.returncode, time.time() - start
+            self._ensure_dirs()
+            # Output dirs' mtimes before the run let collect() skip dirs
+            # nothing was added to, which is the usual no-bug case.
+            self._output_mtimes = {
+                info["path"]: os.stat(info["path"]).st_mtime_ns
+                for info in self.dirs.values()
+                if info["type"] == "output"
+            }
+            for cmd in self.cmds:
+                # Output is never read; discard it rather than buffering it in memory.
+                # close_fds=False is needed for posix_spawn; Python opens fds
+                # non-inheritable by default, so nothing extra leaks to the child.
+                procs.append(subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
+                ))
+            codes = []
+            for proc in procs:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                codes.append(proc.wait(remaining))
         except subprocess.TimeoutExpired:
             return -1, time.time() - start
         except Exception:
             return -1, time.time() - start
+        finally:
+            # SIGTERM first so typefuzz can write out what it has found, then
+            # SIGKILL anything still running after the grace period.
+            live = [proc for proc in procs if proc.poll() is None]
+            for proc in live:
+                proc.terminate()
+            grace_end = time.monotonic() + self.KILL_GRACE_SECS
+            for proc in live:
+                try:
+                    proc.wait(max(0.0, grace_end - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+        # A bug from any instance wins; otherwise all instances saw the same seed.
+        for code in codes:
+            if self.parse_result(code)[0]:
+                return code, time.time() - start
+        return codes[0], time.time() - start
 
     def collect(self) -> List[Path]:
+        # One scandir pass per output dir, matching all bug patterns at once.
+        bug_re = _bug_name_re(tuple(self.DEFAULT_BUG_PATTERNS))
         files = []
         for info in self.dirs.values():
-            if info["type"] == "output" and info["path"].exists():
-                for pattern in self.DEFAULT_BUG_PATTERNS:
-                    files.extend(info["path"].glob(pattern))
+            if info["type"] != "output":
+                continue
+            try:
+                before = self._output_mtimes.get(info["path"])
+                if before is not None and os.stat(info["path"]).st_mtime_ns == before:
+                    continue
+                with os.scandir(info["path"]) as entries:
+                    files.extend(
+                        Path(e.path)
+                        for e in entries
+                        if bug_re.match(e.name) and e.is_file(follow_symlinks=False)
+                    )
+            except FileNotFoundError:
+                pass
         return files
 
     def parse_result(self, exit_code: int) -> Tuple[bool, str]:
-        entry = self.DEFAULT_EXIT_CODES.get(str(exit_code), self.DEFAULT_EXIT_ACTION)
-        return entry["bug_found"], entry["action"]
+        return self.DEFAULT_EXIT_CODES.get(exit_code, self.DEFAULT_EXIT_ACTION)
 
     def cleanup(self):
+        # Rename temp dirs out of the way and delete them in the background,
+        # so the next run can recreate them without waiting on rmtree.
+        if not self._dirs_created:
+            return
         for info in self.dirs.values():
             if info["type"] == "temp":
-                shutil.rmtree(info["path"], ignore_errors=True)
+                stale = f"{info['path']}.stale.{os.getpid()}.{next(_stale_seq)}"
+                try:
+                    os.rename(info["path"], stale)
+                except OSError:
+                    shutil.rmtree(info["path"], ignore_errors=True)
+                    continue
+                # Not a daemon: process exit (including a forked worker's
+                # multiprocessing bootstrap) joins it, so the last run's
+                # stale tree isn't left behind in cwd.
+                threading.Thread(
+                    target=shutil.rmtree, args=(stale,), kwargs={"ignore_errors": True}
+                ).start()
@@ -11,6 +11,8 @@ Usage:
 
 import argparse
 import json
+import os
+import string
 import sys
 from pathlib import Path
 
@@ -157,22 +159,41 @@ jobs:
 def discover_solvers():
     """Return list of (solver_name, display_name) from solver.json files."""
     solvers = []
-    for config_file in sorted(SOLVERS_DIR.glob("*/solver.json")):
-        solver_name = config_file.parent.name
-        with open(config_file) as f:
-            config = json.load(f)
-        display_name = config.get("display_name", solver_name.upper())
-        solvers.append((solver_name, display_name))
+    with os.scandir(SOLVERS_DIR) as entries:
+        solver_dirs = sorted((e for e in entries if e.is_dir(follow_symlinks=False)), key=lambda e: e.name)
+    for entry in solver_dirs:
+        try:
+            with open(os.path.join(entry.path, "solver.json")) as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            continue
+        display_name = config.get("display_name", entry.name.upper())
+        solvers.append((entry.name, display_name))
     return solvers
 
 
+def _compile_template(template):
+    """Pre-split a str.format template into (literal, field_name) pairs."""
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+
+def _render(parts, values):
+    return "".join(literal + (values[field] if field is not None else "") for literal, field in parts)
+
+
+# Parsed once, so generating many solvers does not re-parse the templates
+_COMPILED_TEMPLATES = tuple(
+    (_compile_template(template_name), _compile_template(template))
+    for template_name, template in TEMPLATES.items()
+)
+
+
 def generate_for_solver(solver, name):
     """Generate all workflow files for a solver. Returns dict of filename -> content."""
+    values = {"solver": solver, "name": name}
     files = {}
-    for template_name, template in TEMPLATES.items():
-        filename = template_name.format(solver=solver)
-        content = template.format(solver=solver, name=name)
-        files[filename] = content
+    for name_parts, content_parts in _COMPILED_TEMPLATES:
+        files[_render(name_parts, values)] = _render(content_parts, values)
     return files
 
 
@@ -199,11 +220,21 @@ def main():
 
     if args.write:
         WORKFLOWS_DIR.mkdir(parents=True, exist_ok=True)
+        written = 0
         for filename, content in sorted(all_files.items()):
             path = WORKFLOWS_DIR / filename
-            path.write_text(content)
+            data = content.encode()
+            # Leave unchanged files alone so their mtime is preserved
+            try:
+                if path.stat().st_size == len(data) and path.read_bytes() == data:
+                    print(f"  unchanged {path.relative_to(REPO_ROOT)}")
+                    continue
+            except FileNotFoundError:
+                pass
+            path.write_bytes(data)
+            written += 1
             print(f"  wrote {path.relative_to(REPO_ROOT)}")
-        print(f"\nGenerated {len(all_files)} workflow files for {len(solvers)} solver(s)")
+        print(f"\nGenerated {len(all_files)} workflow files for {len(solvers)} solver(s), {written} changed")
     else:
         for filename in sorted(all_files.keys()):
             print(f"  {filename}")
@@ -4,9 +4,12 @@ Discovers available solvers by globbing scripts/solvers/*/solver.json
 and available fuzzers by globbing scripts/fuzzers/*/fuzzer.json.
 """
 
+import copy
+import functools
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Root of the scripts/ directory, resolved from this file's location
 _SCRIPTS_DIR = Path(__file__).resolve().parent.parent
@@ -17,20 +20,34 @@ _FUZZERS_DIR = _SCRIPTS_DIR / "fuzzers"
 DEFAULT_ORACLE = "cvc5"
 
 
+# Config files do not change during a run, so discovery and loading are
+# cached per process. The public accessors hand out deep copies, so a caller
+# mutating its config can't change it for the rest of the process.
+
+@functools.lru_cache(maxsize=None)
+def _discover(root: Path, filename: str) -> Tuple[str, ...]:
+    """Names of the subdirectories of root that contain filename, sorted."""
+    with os.scandir(root) as entries:
+        return tuple(sorted(
+            e.name for e in entries
+            if e.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(e.path, filename))
+        ))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(config_path: Path) -> Dict:
+    with open(config_path) as f:
+        return json.load(f)
+
+
 def discover_solvers() -> List[str]:
     """Return list of solver names that have a solver.json config."""
-    solvers = []
-    for config_file in sorted(_SOLVERS_DIR.glob("*/solver.json")):
-        solvers.append(config_file.parent.name)
-    return solvers
+    return list(_discover(_SOLVERS_DIR, "solver.json"))
 
 
 def discover_fuzzers() -> List[str]:
     """Return list of fuzzer names that have a fuzzer.json config."""
-    fuzzers = []
-    for config_file in sorted(_FUZZERS_DIR.glob("*/fuzzer.json")):
-        fuzzers.append(config_file.parent.name)
-    return fuzzers
+    return list(_discover(_FUZZERS_DIR, "fuzzer.json"))
 
 
 def get_solver_config(name: str) -> Dict:
@@ -44,8 +61,7 @@ def get_solver_config(name: str) -> Dict:
             f"Solver config not found: {config_path}\n"
             f"Available solvers: {discover_solvers()}"
         )
-    with open(config_path) as f:
-        return json.load(f)
+    return copy.deepcopy(_load_config(config_path))
 
 
 def get_fuzzer_config(name: str) -> Dict:
@@ -59,8 +75,7 @@ def get_fuzzer_config(name: str) -> Dict:
             f"Fuzzer config not found: {config_path}\n"
             f"Available fuzzers: {discover_fuzzers()}"
         )
-    with open(config_path) as f:
-        return json.load(f)
+    return copy.deepcopy(_load_config(config_path))
 
 
 def get_oracle_name(solver_name: str, override: Optional[str] = None) -> str:
@@ -99,7 +114,13 @@ def get_fuzzer_params(solver_name: str, fuzzer_name: str) -> Dict:
       2. fuzzer.json  -> default_{param}
 
     Returns a plain dict that can be spread into build_command(**params).
+    The resolution is cached; each call gets its own copy to modify.
     """
+    return copy.deepcopy(_resolve_fuzzer_params(solver_name, fuzzer_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_fuzzer_params(solver_name: str, fuzzer_name: str) -> Dict:
     fuzzer_config = get_fuzzer_config(fuzzer_name)
 
     # Collect defaults: default_iterations -> iterations, etc.
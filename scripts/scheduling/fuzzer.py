@@ -2,9 +2,10 @@
 """Fuzzer job - selects least-fuzzed commit from fuzzing schedule"""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from scripts.scheduling.s3_state import get_state_manager, S3StateError
+from scripts.scheduling.s3_state import find_least_fuzzed, get_state_manager, S3StateError
 
 
 def get_least_fuzzed_commit(solver: str) -> Optional[str]:
@@ -18,16 +19,7 @@ def get_least_fuzzed_commit(solver: str) -> Optional[str]:
     if not schedule:
         return None
     
-    # Find minimum fuzz_count
-    min_fuzz_count = min(c.get('fuzz_count', 0) for c in schedule)
-    
-    # Find first commit with minimum fuzz_count (oldest among least-fuzzed)
-    for commit_info in schedule:
-        if commit_info.get('fuzz_count', 0) == min_fuzz_count:
-            return commit_info.get('hash')
-    
-    # Fallback (shouldn't happen)
-    return schedule[0].get('hash')
+    return find_least_fuzzed(schedule).get('hash')
 
 
 def increment_fuzz_count_and_manage(solver: str, commit_hash: str) -> None:
@@ -38,34 +30,28 @@ def increment_fuzz_count_and_manage(solver: str, commit_hash: str) -> None:
     so we don't increment it again here. This function only handles schedule management."""
     manager = get_state_manager(solver)
     
-    # Verify commit exists in schedule
+    # One pass: this commit's fuzz_count and the oldest fuzzed commit
+    # (first in list with fuzz_count > 0)
     schedule = manager.get_fuzzing_schedule()
-    commit_found = any(c.get('hash') == commit_hash for c in schedule)
+    current_fuzz_count = None
+    oldest_fuzzed = None
+    for commit_info in schedule:
+        fuzz_count = commit_info.get('fuzz_count', 0)
+        if current_fuzz_count is None and commit_info.get('hash') == commit_hash:
+            current_fuzz_count = fuzz_count
+        if oldest_fuzzed is None and fuzz_count > 0:
+            oldest_fuzzed = commit_info['hash']
     
-    if not commit_found:
+    if current_fuzz_count is None:
         print(f"⚠️  Commit {commit_hash[:8]} not found in schedule (may have been removed)", file=sys.stderr)
         return
     
-    # Get current fuzz_count for logging
-    current_fuzz_count = None
-    for commit in schedule:
-        if commit.get('hash') == commit_hash:
-            current_fuzz_count = commit.get('fuzz_count', 0)
-            break
-    
     print(f"✅ Fuzzing completed for {commit_hash[:8]} (fuzz_count: {current_fuzz_count})")
     
     # Check schedule size and manage if needed
     schedule_size = len(schedule)
     
     if schedule_size > 4:
-        # Find oldest fuzzed commit (first in list with fuzz_count > 0)
-        oldest_fuzzed = None
-        for commit_info in schedule:
-            if commit_info.get('fuzz_count', 0) > 0:
-                oldest_fuzzed = commit_info['hash']
-                break
-        
         # If no fuzzed commits found, remove oldest commit (first in list)
         if not oldest_fuzzed:
             oldest_fuzzed = schedule[0].get('hash')
@@ -76,7 +62,7 @@ def increment_fuzz_count_and_manage(solver: str, commit_hash: str) -> None:
 
 
 from typing import Tuple
-def run_fuzzer(solver: str, verify_binary: bool = True) -> Tuple[Optional[str], Optional[str]]:
+def run_fuzzer(solver: str) -> Tuple[Optional[str], Optional[str]]:
     """Get commit to fuzz from schedule and latest build to use.
     Returns (commit_to_fuzz, latest_build_to_use) tuple.
     
@@ -85,9 +71,15 @@ def run_fuzzer(solver: str, verify_binary: bool = True) -> Tuple[Optional[str],
     
     This allows fuzzing old commits using the latest build to avoid discovering
     bugs that were already fixed in newer commits."""
+    pool = ThreadPoolExecutor(max_workers=1)
     try:
         manager = get_state_manager(solver)
         
+        # The build listing does not depend on the schedule, so it runs in the
+        # background while the schedule is read and updated (boto3 clients
+        # are thread-safe).
+        build_future = pool.submit(manager.get_latest_available_build)
+        
         # Step 1: Get commit to fuzz (oldest from schedule, FIFO)
         schedule = manager.get_fuzzing_schedule()
         if not schedule:
@@ -102,7 +94,7 @@ def run_fuzzer(solver: str, verify_binary: bool = True) -> Tuple[Optional[str],
         
         # Step 2: Get latest available build from S3
         try:
-            latest_build = manager.get_latest_available_build()
+            latest_build = build_future.result()
             if not latest_build:
                 print("⏭️  No builds available in S3", file=sys.stderr)
                 return None, None
@@ -110,19 +102,9 @@ def run_fuzzer(solver: str, verify_binary: bool = True) -> Tuple[Optional[str],
             print(f"❌ Error getting latest build: {e}", file=sys.stderr)
             return None, None
         
-        if verify_binary:
-            from botocore.exceptions import ClientError
-            from scripts.scheduling.s3_state import DEFAULT_STATE_VERSION
-            
-            s3_key = f"solvers/{solver}/builds/{DEFAULT_STATE_VERSION}/production/{latest_build}.tar.gz"
-            
-            try:
-                manager.s3_client.head_object(Bucket=manager.bucket, Key=s3_key)
-            except ClientError as e:
-                if e.response.get('Error', {}).get('Code') == '404':
-                    print(f"⚠️  Binary not found for latest build {latest_build[:8]}, skipping", file=sys.stderr)
-                    return None, None
-                raise S3StateError(f"Error checking binary existence: {e}")
+        # No separate binary check: get_latest_available_build only returns
+        # hashes taken from the production/*.tar.gz listing, so the binary
+        # existed when it was listed.
         
         print(f"✅ Selected commit {commit_to_fuzz[:8]} to fuzz using latest build {latest_build[:8]}", file=sys.stderr)
         return commit_to_fuzz, latest_build
@@ -132,6 +114,11 @@ def run_fuzzer(solver: str, verify_binary: bool = True) -> Tuple[Optional[str],
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Early returns don't wait here for a listing nobody will use. The
+        # interpreter still joins the pool's thread at exit, so the process
+        # ends once an in-flight listing finishes.
+        pool.shutdown(wait=False)
 
 
 if __name__ == '__main__':
@@ -144,7 +131,7 @@ if __name__ == '__main__':
     
     # Select commit command
     select_parser = subparsers.add_parser('select', help='Select least-fuzzed commit')
-    select_parser.add_argument('--no-verify', action='store_true', help='Skip binary existence check')
+    select_parser.add_argument('--no-verify', action='store_true', help='Deprecated, has no effect: the build listing already confirms the binary exists')
     select_parser.add_argument('--json', action='store_true', help='Output as JSON')
     
     # Increment fuzz count command
@@ -154,7 +141,7 @@ if __name__ == '__main__':
     args = parser.parse_args()
     
     if args.command == 'select':
-        commit_to_fuzz, latest_build = run_fuzzer(args.solver, verify_binary=not args.no_verify)
+        commit_to_fuzz, latest_build = run_fuzzer(args.solver)
         if args.json:
             import json
             result = {
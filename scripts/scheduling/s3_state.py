@@ -31,6 +31,20 @@ class S3StateConflictError(S3StateError):
 DEFAULT_STATE_VERSION = "v2"
 
 
+def find_least_fuzzed(schedule: list) -> Optional[dict]:
+    """Return the oldest schedule entry with the lowest fuzz_count, or None if empty.
+    fuzz_count is never negative, so the first unfuzzed entry ends the scan."""
+    best = None
+    best_count = None
+    for commit in schedule:
+        fuzz_count = commit.get('fuzz_count', 0)
+        if best is None or fuzz_count < best_count:
+            best, best_count = commit, fuzz_count
+            if fuzz_count <= 0:
+                break
+    return best
+
+
 class S3StateManager:
     def __init__(self, bucket: str, solver: str, region: Optional[str] = None):
         self.bucket = bucket
@@ -244,16 +258,9 @@ class S3StateManager:
             if not schedule:
                 return schedule
             
-            # Find minimum fuzz_count
-            min_fuzz_count = min(c.get('fuzz_count', 0) for c in schedule)
-            
-            # Find first commit with minimum fuzz_count (oldest among least-fuzzed)
-            for commit in schedule:
-                if commit.get('fuzz_count', 0) == min_fuzz_count:
-                    # Atomically increment fuzz_count
-                    commit['fuzz_count'] = commit.get('fuzz_count', 0) + 1
-                    return schedule
-            
+            commit = find_least_fuzzed(schedule)
+            # Atomically increment fuzz_count
+            commit['fuzz_count'] = commit.get('fuzz_count', 0) + 1
             return schedule
         
         schedule_before = self.get_fuzzing_schedule(version=version)
@@ -261,12 +268,7 @@ class S3StateManager:
             return None
         
         # Find which commit will be selected (before increment)
-        min_fuzz_count = min(c.get('fuzz_count', 0) for c in schedule_before)
-        selected_commit = None
-        for commit in schedule_before:
-            if commit.get('fuzz_count', 0) == min_fuzz_count:
-                selected_commit = commit.get('hash')
-                break
+        selected_commit = find_least_fuzzed(schedule_before).get('hash')
         
         if selected_commit:
             # Atomically update: select and increment in one operation
@@ -11,21 +11,45 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import os
+import platform
+import re
 import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import HTTPError as Urllib3Error
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: 'requests' package is required. Install with: pip install requests")
     sys.exit(1)
 
 
+# Large enough that per-chunk Python overhead is negligible on a multi-MB archive
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Archives at least this large are fetched as DOWNLOAD_PARTS parallel range
+# requests; below it the extra requests cost more than a single stream.
+PARALLEL_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+DOWNLOAD_PARTS = 4
+
+# ETag + body of earlier /releases/latest responses. Conditional requests that
+# come back 304 do not count against the GitHub API rate limit.
+RELEASE_CACHE_PATH = Path.home() / ".cache" / "fm-fuzz" / "releases.json"
+
+
 def _scripts_dir():
     return Path(__file__).resolve().parent.parent
 
@@ -39,31 +63,76 @@ def _read_solver_config(solver_name):
         return json.load(f)
 
 
-def install_unzip():
-    if shutil.which("unzip"):
-        return
-    print("Installing unzip...")
+def make_session(github_token=None):
+    """One session for the API call and the asset download.
+
+    Connections are reused, and transient failures (429/5xx) are retried with
+    backoff, honouring Retry-After. A 403 rate limit is not retried: it will
+    not clear within a backoff window.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = "FM-Fuzz/1.0"
+    if github_token:
+        session.headers["Authorization"] = f"token {github_token}"
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+def _load_release_cache():
     try:
-        subprocess.run(["sudo", "apt-get", "update"], check=True, capture_output=True)
-        subprocess.run(
-            ["sudo", "apt-get", "install", "-y", "unzip"],
-            check=True,
-            capture_output=True,
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("ERROR: Cannot install unzip automatically. Please install it manually.")
-        sys.exit(1)
+        with open(RELEASE_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 
+def _save_release_cache(cache):
+    try:
+        RELEASE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = RELEASE_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, RELEASE_CACHE_PATH)
+    except OSError as e:
+        print(f"WARNING: Could not write release cache: {e}")
 
-def get_latest_release(repo, github_token=None):
+
+def _max_age(response):
+    match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+    return int(match.group(1)) if match else 0
+
+
+def get_latest_release(repo, session):
     url = f"https://api.github.com/repos/{repo}/releases/latest"
-    headers = {"User-Agent": "FM-Fuzz/1.0"}
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
+    cache = _load_release_cache()
+    cached = cache.get(repo)
+    if cached and time.time() < cached.get("expires", 0):
+        return cached["release"]
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        response = session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            release = cached["release"]
+        else:
+            response.raise_for_status()
+            release = response.json()
+        cache[repo] = {
+            "etag": response.headers.get("ETag") or (cached or {}).get("etag"),
+            "expires": time.time() + _max_age(response),
+            "release": release,
+        }
+        _save_release_cache(cache)
+        return release
     except requests.RequestException as e:
         print(f"ERROR: Failed to get latest release from {repo}: {e}")
         if (
@@ -77,67 +146,172 @@ def get_latest_release(repo, github_token=None):
         sys.exit(1)
 
 
+# Linux x86_64 archives. z3 names its Linux builds by glibc version
+# (z3-4.x-x64-glibc-2.35.zip) rather than "linux".
+_LINUX_X86_ASSET_RE = re.compile(
+    r"(?=.*(?:linux|glibc))(?=.*(?:x86[_-]?64|x64|amd64)).*\.(tar\.gz|zip)$", re.IGNORECASE
+)
+_GLIBC_RE = re.compile(r"glibc-?(\d+)\.(\d+)", re.IGNORECASE)
+
+
+def _local_glibc():
+    libc, version = platform.libc_ver()
+    try:
+        return tuple(int(x) for x in version.split(".")[:2]) if libc == "glibc" else None
+    except ValueError:
+        return None
+
+
 def find_linux_binary_asset(assets):
-    """Find a Linux x86_64 binary asset from release assets."""
+    """Find the best Linux x86_64 binary asset from release assets.
+
+    Among matching archives, prefer builds whose glibc this machine can run,
+    then non-debug, then static, then the newest glibc, then .tar.gz.
+    Ties keep the release's asset order.
+    """
+    local_glibc = _local_glibc()
+    best_url, best_score = None, None
     for asset in assets:
-        url = asset["browser_download_url"].lower()
-        is_linux = "linux" in url
-        is_x86 = "x86_64" in url or "x64" in url
-        is_archive = url.endswith(".zip") or url.endswith(".tar.gz")
-        if is_linux and is_x86 and is_archive:
-            return asset["browser_download_url"]
+        url = asset["browser_download_url"]
+        name = url.rsplit("/", 1)[-1]
+        match = _LINUX_X86_ASSET_RE.match(name)
+        if not match:
+            continue
+        glibc = _GLIBC_RE.search(name)
+        glibc = (int(glibc.group(1)), int(glibc.group(2))) if glibc else (0, 0)
+        lower = name.lower()
+        score = (
+            local_glibc is None or glibc <= local_glibc,
+            "debug" not in lower,
+            "static" in lower,
+            glibc,
+            match.group(1).lower() == "tar.gz",
+        )
+        if best_score is None or score > best_score:
+            best_url, best_score = url, score
+    return best_url
+
+
+def _install_binary(src, output_dir, binary_name):
+    # Written next to the target and renamed over it, so an interrupted
+    # download never leaves a truncated binary at output_path.
+    output_path = os.path.join(output_dir, binary_name)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=f".{binary_name}.")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            shutil.copyfileobj(src, out, DOWNLOAD_CHUNK_SIZE)
+        os.chmod(tmp_path, 0o755)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    print(f"Installed to: {output_path}")
+    return output_path
+
+
+def _fetch_ranges(session, url, size, same_host):
+    """Download url into memory as DOWNLOAD_PARTS parallel byte-range requests."""
+    buf = bytearray(size)
+    step = -(-size // DOWNLOAD_PARTS)
+    # The token is only for GitHub; signed CDN URLs reject extra auth.
+    headers = {} if same_host else {"Authorization": None}
+
+    def fetch(start):
+        end = min(start + step, size) - 1
+        response = session.get(
+            url, headers={**headers, "Range": f"bytes={start}-{end}"}, timeout=60
+        )
+        response.raise_for_status()
+        if response.status_code != 206 or len(response.content) != end - start + 1:
+            raise requests.RequestException(f"Unexpected response for bytes {start}-{end}")
+        buf[start:end + 1] = response.content
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as pool:
+        list(pool.map(fetch, range(0, size, step)))
+    return io.BytesIO(buf)
+
+
+def _extract_binary(fileobj, is_zip, binary_name, output_dir):
+    print("Extracting...")
+    if is_zip:
+        with zipfile.ZipFile(fileobj) as zf:
+            for info in zf.infolist():
+                if not info.is_dir() and os.path.basename(info.filename) == binary_name:
+                    with zf.open(info) as src:
+                        return _install_binary(src, output_dir, binary_name)
+    else:
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as tf:
+            for member in tf:
+                if member.isfile() and os.path.basename(member.name) == binary_name:
+                    return _install_binary(tf.extractfile(member), output_dir, binary_name)
     return None
 
 
-def download_and_extract(asset_url, binary_name, output_dir, github_token=None):
+def download_and_extract(asset_url, binary_name, output_dir, session):
+    """Download the release archive and extract only the solver binary.
+
+    Large archives on servers that accept byte ranges are fetched as parallel
+    range requests into memory. Otherwise tar.gz archives are read straight
+    from the response, and zip archives (which need random access) are
+    buffered in memory. Nothing touches disk except the binary itself.
+    """
     print(f"Downloading: {asset_url}")
+    is_zip = asset_url.lower().endswith(".zip")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        is_zip = asset_url.lower().endswith(".zip")
-        ext = ".zip" if is_zip else ".tar.gz"
-        archive_path = os.path.join(temp_dir, f"solver{ext}")
+    # The HEAD only sizes the optional parallel path. Signed CDN URLs and
+    # proxies may reject it where a GET works, so any failure there just
+    # means "size unknown" and the archive is streamed instead.
+    ranged_url, size = None, 0
+    try:
+        head = session.head(asset_url, allow_redirects=True, timeout=60)
+        head.raise_for_status()
+        size = int(head.headers.get("Content-Length", 0))
+        if (
+            size >= PARALLEL_DOWNLOAD_MIN_SIZE
+            and head.headers.get("Accept-Ranges") == "bytes"
+            and not head.headers.get("Content-Encoding")
+        ):
+            ranged_url = head.url
+    except (requests.RequestException, Urllib3Error, ValueError):
+        pass
 
-        headers = {"User-Agent": "FM-Fuzz/1.0"}
-        if github_token:
-            headers["Authorization"] = f"token {github_token}"
-        try:
-            response = requests.get(
-                asset_url, headers=headers, timeout=60, stream=True
-            )
-            response.raise_for_status()
-            with open(archive_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-        except requests.RequestException as e:
-            print(f"ERROR: Failed to download: {e}")
-            sys.exit(1)
-
-        print("Extracting...")
-        extract_dir = os.path.join(temp_dir, "extracted")
-        os.makedirs(extract_dir, exist_ok=True)
-
-        if is_zip:
-            subprocess.run(
-                ["unzip", "-q", archive_path, "-d", extract_dir], check=True
-            )
+    try:
+        ranged = None
+        if ranged_url:
+            same_host = urlparse(ranged_url).netloc == urlparse(asset_url).netloc
+            try:
+                ranged = _fetch_ranges(session, ranged_url, size, same_host)
+            except (requests.RequestException, Urllib3Error) as e:
+                # Servers that advertise ranges don't always honour them
+                print(f"WARNING: Range download failed ({e}), streaming instead")
+        if ranged is not None:
+            binary_path = _extract_binary(ranged, is_zip, binary_name, output_dir)
         else:
-            subprocess.run(
-                ["tar", "-xzf", archive_path, "-C", extract_dir], check=True
-            )
-
-        # Find the binary in extracted files
-        for root, dirs, files in os.walk(extract_dir):
-            if binary_name in files:
-                src = os.path.join(root, binary_name)
-                if os.path.isfile(src):
-                    output_path = os.path.join(output_dir, binary_name)
-                    shutil.copy2(src, output_path)
-                    os.chmod(output_path, 0o755)
-                    print(f"Installed to: {output_path}")
-                    return output_path
+            response = session.get(asset_url, timeout=60, stream=True)
+            response.raise_for_status()
+            with response:
+                # Read the raw stream so the copy loop runs in shutil/urllib3, not
+                # per chunk in Python; decode_content undoes any Content-Encoding.
+                response.raw.decode_content = True
+                fileobj = response.raw
+                if is_zip:
+                    fileobj = io.BytesIO()
+                    shutil.copyfileobj(response.raw, fileobj, DOWNLOAD_CHUNK_SIZE)
+                binary_path = _extract_binary(fileobj, is_zip, binary_name, output_dir)
+    except (requests.RequestException, Urllib3Error) as e:
+        print(f"ERROR: Failed to download: {e}")
+        sys.exit(1)
+    except (tarfile.TarError, zipfile.BadZipFile, EOFError) as e:
+        print(f"ERROR: Failed to extract archive: {e}")
+        sys.exit(1)
 
+    if binary_path is None:
         print(f"ERROR: '{binary_name}' binary not found in archive")
         sys.exit(1)
+    return binary_path
 
 
 def main():
@@ -162,6 +336,11 @@ def main():
         default=os.path.join(os.path.expanduser("~"), ".local", "bin"),
         help="Output directory (default: ~/.local/bin)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download even if the installed binary came from the same release asset",
+    )
     args = parser.parse_args()
 
     # Resolve repo and binary name
@@ -181,14 +360,13 @@ def main():
         print("Add 'ci.github_release_repo' to solver.json")
         sys.exit(1)
 
-    install_unzip()
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    github_token = os.environ.get("GITHUB_TOKEN")
+    session = make_session(os.environ.get("GITHUB_TOKEN"))
 
     print(f"Finding latest {binary_name} release from {repo}...")
-    release = get_latest_release(repo, github_token)
+    release = get_latest_release(repo, session)
     tag = release["tag_name"]
     print(f"Latest release: {tag}")
 
@@ -197,7 +375,22 @@ def main():
         print(f"ERROR: Linux x86_64 binary not found in {tag}")
         sys.exit(1)
 
-    binary_path = download_and_extract(binary_url, binary_name, str(output_dir), github_token)
+    # Records which asset the installed binary came from, so a rerun against
+    # an unchanged release skips the download and the --version check.
+    marker = output_dir / f".{binary_name}.release"
+    installed = output_dir / binary_name
+    if not args.force and installed.is_file():
+        try:
+            if marker.read_text().strip() == binary_url:
+                print(f"{binary_name} {tag} already installed at {installed}")
+                return
+        except OSError:
+            pass
+
+    # The binary is replaced atomically, so a failed run leaves the old
+    # binary and its marker in place; the marker is updated only after.
+    binary_path = download_and_extract(binary_url, binary_name, str(output_dir), session)
+    marker.write_text(binary_url + "\n")
 
     # Verify
     result = subprocess.run(
@@ -22,7 +22,7 @@ sudo apt-get install -y \
 if [[ "$ENABLE_COVERAGE" == "true" ]]; then
     echo "Installing coverage tools..."
     sudo apt-get install -y lcov gcc libgtest-dev
-    pip3 install fastcov psutil
+    pip3 install fastcov psutil orjson
 fi
 
 echo "Cloning Bitwuzla..."
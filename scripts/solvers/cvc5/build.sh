@@ -47,7 +47,7 @@ if [[ "$ENABLE_COVERAGE" == "true" ]]; then
     echo "📊 Installing coverage tools..."
     sudo apt-get install -y lcov gcc
     # Install fastcov and psutil for coverage analysis
-    pip3 install fastcov psutil
+    pip3 install fastcov psutil orjson
     
     # Set environment variables for coverage collection
     export GCOV_PREFIX=$(pwd)/cvc5/build
@@ -7,10 +7,26 @@ Usage: gen_test_manifest.py <z3test_dir>
 Output: [{"file": "regressions/sub/test.smt2", "flags": []}]
 """
 import json
+import os
 import sys
 from pathlib import Path
 
 
+def iter_tests(top: str, prefix: str):
+    """Yield relative paths of entries named *.smt* under top, like rglob("*.smt*").
+
+    Uses os.scandir and plain strings so the ~30k regressions don't each
+    cost a pair of Path objects; symlinked directories aren't followed.
+    """
+    with os.scandir(top) as entries:
+        for entry in entries:
+            rel_path = prefix + entry.name
+            if ".smt" in entry.name:
+                yield rel_path
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_tests(entry.path, rel_path + "/")
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: gen_test_manifest.py <z3test_dir>", file=sys.stderr)
@@ -24,11 +40,11 @@ def main():
         sys.exit(1)
 
     entries = []
-    for test_file in sorted(regress_dir.rglob("*.smt*")):
-        if test_file.name.endswith(".disabled"):
+    # Sort by path components, matching the order of sorted(Path) objects
+    for rel_path in sorted(iter_tests(str(regress_dir), "regressions/"), key=lambda p: p.split("/")):
+        if rel_path.endswith(".disabled"):
             continue
-        rel_path = test_file.relative_to(base_dir)
-        entries.append({"file": str(rel_path), "flags": []})
+        entries.append({"file": rel_path, "flags": []})
 
     print(json.dumps(entries))
 
@@ -124,3 +124,136 @@ def test_resolve_base_dir_uses_build_parent_plus_subdir(tmp_path):
     mapper.cov_config["test_subdir"] = "test/regress/cli"
     result = mapper._resolve_manifest_base_dir()
     assert result == (tmp_path / "cvc5" / "test" / "regress" / "cli")
+
+
+def test_parse_lcov_info_keeps_mangled_names(tmp_path):
+    """Executed functions are keyed by mangled name, without running c++filt."""
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    mapper = make_mapper(build_dir)
+    lcov_file = tmp_path / "fastcov.info"
+    lcov_file.write_text(
+        "TN:\nSF:/root/bitwuzla/src/a.cpp\n"
+        "FN:3,_Z1fv\nFN:7,_Z1gv\nFN:9,_Z1hv\n"
+        "FNDA:0,_Z1hv\nFNDA:1,_Z1fv\nFNDA:2,_Z1gv\n"
+        "DA:3,1\nend_of_record\n"
+        "TN:\nSF:/usr/include/c++/vector\nFN:1,_Z1kv\nFNDA:5,_Z1kv\nend_of_record\n"
+    )
+
+    with patch("coverage_mapper.subprocess.run") as mock:
+        result = mapper.parse_lcov_info(lcov_file, "t.smt2")
+
+    mock.assert_not_called()
+    assert result == {"test_name": "t.smt2", "functions": ["src/a.cpp:_Z1fv:3", "src/a.cpp:_Z1gv:7"]}
+
+
+def test_use_gcov_prefix_shadows_gcno_files(tmp_path):
+    """Each .gcno is symlinked under prefix + its absolute dir; only those .gcda paths are checked."""
+    build_dir = tmp_path / "build"
+    (build_dir / "src" / "obj").mkdir(parents=True)
+    (build_dir / "src" / "obj" / "a.gcno").write_bytes(b"gcno")
+    (build_dir / "src" / "b.gcno").write_bytes(b"gcno")
+    (build_dir / "src" / "notes.txt").write_text("")
+    mapper = make_mapper(build_dir)
+    prefix = str(tmp_path / "shadow")
+
+    mapper.use_gcov_prefix(prefix)
+
+    shadow_obj = Path(prefix + str(build_dir.resolve() / "src" / "obj"))
+    assert (shadow_obj / "a.gcno").resolve() == (build_dir / "src" / "obj" / "a.gcno").resolve()
+    assert mapper._solver_env["GCOV_PREFIX"] == prefix
+    assert mapper._solver_env["GCOV_PREFIX_STRIP"] == "0"
+    assert not mapper.has_coverage_data()
+
+    # A run in the build tree itself doesn't count; one in the shadow tree does
+    (build_dir / "src" / "obj" / "a.gcda").write_bytes(b"")
+    assert not mapper.has_coverage_data()
+    (shadow_obj / "a.gcda").write_bytes(b"")
+    assert mapper.has_coverage_data()
+
+    mapper.reset_coverage_counters()
+    assert not mapper.has_coverage_data()
+    assert not (shadow_obj / "a.gcda").exists()
+
+
+def test_manifest_cache_key_skips_dirty_test_tree(tmp_path):
+    """Uncommitted test changes disable the discovery cache; a clean tree gets a stable key."""
+    import subprocess
+    import coverage_mapper as cm
+
+    tests_dir = tmp_path / "regress"
+    tests_dir.mkdir()
+    (tests_dir / "a.smt2").write_text("(check-sat)\n")
+    script = tmp_path / "gen_test_manifest.py"
+    script.write_text("")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run(git + ["init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(git + ["add", "-A"], cwd=tmp_path, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+
+    key = cm.CoverageMapper._manifest_cache_key(script, tests_dir)
+    assert key is not None
+    assert cm.CoverageMapper._manifest_cache_key(script, tests_dir) == key
+
+    (tests_dir / "b.smt2").write_text("(check-sat)\n")
+    assert cm.CoverageMapper._manifest_cache_key(script, tests_dir) is None
+    (tests_dir / "b.smt2").unlink()
+    (tests_dir / "a.smt2").write_text("(set-logic QF_BV)\n(check-sat)\n")
+    assert cm.CoverageMapper._manifest_cache_key(script, tests_dir) is None
+
+
+def test_subsumed_tests_run_fast_and_are_not_recorded(tmp_path):
+    """After subsumption_window tests add nothing new, the directory runs with fast_flags, unrecorded."""
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    mapper = make_mapper(build_dir)
+    mapper.fast_flags = ["--parse-only"]
+    mapper.subsumption_window = 2
+
+    def fake_run(test_info):
+        return {"test_name": test_info[1], "functions": ["src/a.cpp:_Z1fv:3"]}
+
+    tests = [(i, f"bv/t{i}.smt2", []) for i in range(1, 6)] + [(6, "fp/t6.smt2", [])]
+    with patch.object(mapper, "process_single_test", side_effect=fake_run) as mock:
+        temp_file = mapper.process_tests(tests)
+
+    flags = [call.args[0][2] for call in mock.call_args_list]
+    # t1 adds the function, t2 and t3 add nothing; t4, t5 are downgraded. fp/ is its own directory.
+    assert flags == [[], [], [], ["--parse-only"], ["--parse-only"], []]
+    with open(temp_file) as f:
+        mapping = json.load(f)
+    assert mapping == {"src/a.cpp:_Z1fv:3": ["bv/t1.smt2", "bv/t2.smt2", "bv/t3.smt2", "fp/t6.smt2"]}
+
+
+def test_fast_flags_off_by_default(tmp_path):
+    """Without fast_flags/subsumption_window config every test runs unchanged and is recorded."""
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    mapper = make_mapper(build_dir)
+
+    tests = [(i, f"bv/t{i}.smt2", []) for i in range(1, 5)]
+    with patch.object(mapper, "process_single_test",
+                      side_effect=lambda t: {"test_name": t[1], "functions": ["f"]}) as mock:
+        temp_file = mapper.process_tests(tests)
+
+    assert all(call.args[0][2] == [] for call in mock.call_args_list)
+    with open(temp_file) as f:
+        assert json.load(f) == {"f": [t[1] for t in tests]}
+
+
+def test_invert_test_stream(tmp_path):
+    """Each function maps to the sorted, de-duplicated tests that covered it."""
+    import coverage_mapper as cm
+    stream = tmp_path / "stream.jsonl"
+    records = [
+        {"test": "b.smt2", "functions": ["f", "g"]},
+        {"test": "a.smt2", "functions": ["g"]},
+        {"test": "b.smt2", "functions": ["g"]},
+        {"test": "c.smt2", "functions": []},
+    ]
+    stream.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    assert dict(cm.CoverageMapper.invert_test_stream(stream)) == {
+        "f": ["b.smt2"],
+        "g": ["a.smt2", "b.smt2"],
+    }
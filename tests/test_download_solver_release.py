@@ -0,0 +1,180 @@
+"""Unit tests for release asset selection and download in download_solver_release."""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts/shared"))
+
+import download_solver_release as dsr
+
+
+def _assets(repo, tag, names):
+    return [{"browser_download_url": f"https://github.com/{repo}/releases/download/{tag}/{n}"}
+            for n in names]
+
+
+def _name(url):
+    return url.rsplit("/", 1)[-1] if url else None
+
+
+CVC5_ASSETS = _assets("cvc5/cvc5", "cvc5-1.2.0", [
+    "cvc5-Linux-arm64-shared-gpl.zip",
+    "cvc5-Linux-arm64-shared.zip",
+    "cvc5-Linux-arm64-static-gpl.zip",
+    "cvc5-Linux-arm64-static.zip",
+    "cvc5-Linux-x86_64-shared-gpl.zip",
+    "cvc5-Linux-x86_64-shared.zip",
+    "cvc5-Linux-x86_64-static-gpl.zip",
+    "cvc5-Linux-x86_64-static.zip",
+    "cvc5-macOS-arm64-shared.zip",
+    "cvc5-macOS-arm64-static.zip",
+    "cvc5-Win64-x86_64-shared.zip",
+    "cvc5-Win64-x86_64-static.zip",
+])
+
+Z3_ASSETS = _assets("Z3Prover/z3", "z3-4.13.0", [
+    "z3-4.13.0-arm64-glibc-2.35.zip",
+    "z3-4.13.0-arm64-osx-11.0.zip",
+    "z3-4.13.0-arm64-win.zip",
+    "z3-4.13.0-x64-glibc-2.31.zip",
+    "z3-4.13.0-x64-glibc-2.35.zip",
+    "z3-4.13.0-x64-osx-11.7.10.zip",
+    "z3-4.13.0-x64-win.zip",
+    "z3-4.13.0-x86-win.zip",
+])
+
+BITWUZLA_ASSETS = _assets("bitwuzla/bitwuzla", "0.7.0", [
+    "Bitwuzla-Linux-arm64-static.zip",
+    "Bitwuzla-Linux-x86_64-static.zip",
+    "Bitwuzla-macOS-arm64-static.zip",
+    "Bitwuzla-Win64-x86_64-static.zip",
+])
+
+
+def test_cvc5_prefers_static_linux_x86_64_build():
+    """A shared build's binary needs its libcvc5.so, so the static archive wins."""
+    with patch.object(dsr, "_local_glibc", return_value=(2, 35)):
+        assert _name(dsr.find_linux_binary_asset(CVC5_ASSETS)) == "cvc5-Linux-x86_64-static-gpl.zip"
+
+
+def test_z3_glibc_build_newest_runnable():
+    """z3 names Linux builds only by glibc; pick the newest this machine can run."""
+    with patch.object(dsr, "_local_glibc", return_value=(2, 35)):
+        assert _name(dsr.find_linux_binary_asset(Z3_ASSETS)) == "z3-4.13.0-x64-glibc-2.35.zip"
+    with patch.object(dsr, "_local_glibc", return_value=(2, 31)):
+        assert _name(dsr.find_linux_binary_asset(Z3_ASSETS)) == "z3-4.13.0-x64-glibc-2.31.zip"
+
+
+def test_bitwuzla_linux_x86_64():
+    with patch.object(dsr, "_local_glibc", return_value=(2, 35)):
+        assert _name(dsr.find_linux_binary_asset(BITWUZLA_ASSETS)) == "Bitwuzla-Linux-x86_64-static.zip"
+
+
+def test_debug_builds_deprioritized_and_tar_gz_preferred():
+    assets = _assets("o/s", "v1", [
+        "s-linux-x86_64-debug.tar.gz",
+        "s-linux-x86_64.zip",
+        "s-linux-x86_64.tar.gz",
+    ])
+    with patch.object(dsr, "_local_glibc", return_value=None):
+        assert _name(dsr.find_linux_binary_asset(assets)) == "s-linux-x86_64.tar.gz"
+
+
+def test_no_linux_x86_64_asset():
+    assets = _assets("o/s", "v1", ["s-macOS-arm64.zip", "s-Win64-x86_64.zip", "s-Linux-arm64.tar.gz"])
+    assert dsr.find_linux_binary_asset(assets) is None
+
+
+def test_install_binary_is_atomic(tmp_path):
+    """A download that fails mid-copy leaves the installed binary and no temp file behind."""
+    import io
+    import os
+
+    target = tmp_path / "cvc5"
+    target.write_bytes(b"old binary")
+
+    class _Broken(io.BytesIO):
+        def read(self, *args):
+            if self.tell():
+                raise OSError("connection reset")
+            return super().read(4)
+
+    with pytest.raises(OSError):
+        dsr._install_binary(_Broken(b"new binary"), str(tmp_path), "cvc5")
+    assert target.read_bytes() == b"old binary"
+    assert os.listdir(tmp_path) == ["cvc5"]
+
+    dsr._install_binary(io.BytesIO(b"new binary"), str(tmp_path), "cvc5")
+    assert target.read_bytes() == b"new binary"
+    assert os.access(target, os.X_OK)
+    assert os.listdir(tmp_path) == ["cvc5"]
+
+
+def _tar_gz(name, data):
+    import io
+    import tarfile
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        info = tarfile.TarInfo(f"solver/bin/{name}")
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _session(archive, head_headers=None, head_error=None, range_status=206):
+    """A session whose HEAD advertises a large ranged archive and whose GETs serve it."""
+    import io
+    from unittest.mock import MagicMock
+
+    url = "https://github.com/o/s/releases/download/v1/s-Linux-x86_64.tar.gz"
+    session = MagicMock()
+    head = MagicMock(url=url, headers=head_headers or {
+        "Content-Length": str(dsr.PARALLEL_DOWNLOAD_MIN_SIZE),
+        "Accept-Ranges": "bytes",
+    })
+    if head_error:
+        head.raise_for_status.side_effect = head_error
+    session.head.return_value = head
+
+    def get(url, headers=None, timeout=None, stream=False):
+        response = MagicMock()
+        if headers and "Range" in headers:
+            # A server that ignores Range and sends the whole body
+            response.status_code = range_status
+            response.content = archive
+        else:
+            response.status_code = 200
+            response.raw = io.BytesIO(archive)
+            response.__enter__.return_value = response
+        return response
+
+    session.get.side_effect = get
+    return url, session
+
+
+def test_ranged_download_falls_back_to_streaming(tmp_path, capsys):
+    archive = _tar_gz("s", b"solver")
+    url, session = _session(archive, range_status=200)
+
+    path = dsr.download_and_extract(url, "s", str(tmp_path), session)
+
+    assert Path(path).read_bytes() == b"solver"
+    assert "Range download failed" in capsys.readouterr().out
+    assert any("Range" in (c.kwargs.get("headers") or {}) for c in session.get.call_args_list)
+    assert session.get.call_args.kwargs.get("stream") is True
+
+
+def test_failed_head_streams_the_archive(tmp_path):
+    import requests
+
+    archive = _tar_gz("s", b"solver")
+    url, session = _session(archive, head_error=requests.HTTPError("403 Forbidden"))
+
+    path = dsr.download_and_extract(url, "s", str(tmp_path), session)
+
+    assert Path(path).read_bytes() == b"solver"
+    assert session.get.call_count == 1
+    assert session.get.call_args.kwargs.get("stream") is True
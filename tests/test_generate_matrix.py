@@ -0,0 +1,36 @@
+"""Unit tests for job partitioning in generate_matrix."""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts/scheduling"))
+sys.path.insert(0, str(REPO_ROOT / "scripts/coverage"))
+
+from generate_matrix import partition_tests
+
+
+def _covers_exactly(ranges, total):
+    covered = [i for start, end in ranges for i in range(start, end + 1)]
+    return covered == list(range(1, total + 1))
+
+
+def test_even_split():
+    assert partition_tests(12, 4) == [(1, 3), (4, 6), (7, 9), (10, 12)]
+
+
+def test_uneven_split_leaves_no_empty_job():
+    ranges = partition_tests(10, 4)
+    assert ranges == [(1, 3), (4, 6), (7, 9), (10, 10)]
+    assert all(start <= end for start, end in ranges)
+
+
+def test_fewer_tests_than_jobs():
+    assert partition_tests(3, 8) == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_ranges_cover_every_test_once():
+    for total in range(1, 60):
+        for jobs in range(1, 12):
+            ranges = partition_tests(total, jobs)
+            assert len(ranges) <= jobs
+            assert _covers_exactly(ranges, total)
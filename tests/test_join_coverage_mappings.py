@@ -0,0 +1,58 @@
+"""Unit tests for demangling in join_coverage_mappings."""
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts/coverage"))
+
+import join_coverage_mappings as jcm
+
+_DEMANGLED = {
+    "_ZN3FooC1Ev": "Foo::Foo()",
+    "_ZN3FooC2Ev": "Foo::Foo()",
+    "_Z3barv": "bar()",
+}
+
+
+def _fake_cxxfilt(cmd, input, **kwargs):
+    out = "".join(_DEMANGLED.get(name, name) + "\n" for name in input.splitlines())
+    return subprocess.CompletedProcess(cmd, 0, stdout=out, stderr="")
+
+
+def test_demangles_ids_with_one_cxxfilt_call(capsys):
+    mapping = {"src/a.cpp:_Z3barv:3": ["t1"], "src/b.cpp:main:9": ["t2"]}
+    with patch("join_coverage_mappings.subprocess.run", side_effect=_fake_cxxfilt) as mock:
+        result = jcm.demangle_function_ids(mapping)
+
+    mock.assert_called_once()
+    assert result == {"src/a.cpp:bar():3": {"t1"}, "src/b.cpp:main:9": {"t2"}}
+    assert capsys.readouterr().out == ""
+
+
+def test_keeps_mangled_names_when_cxxfilt_fails(capsys):
+    mapping = {"src/a.cpp:_Z3barv:3": ["t1"]}
+    failed = subprocess.CompletedProcess(["c++filt"], 1, stdout="", stderr="boom")
+    with patch("join_coverage_mappings.subprocess.run", return_value=failed):
+        assert jcm.demangle_function_ids(mapping) == {"src/a.cpp:_Z3barv:3": {"t1"}}
+    with patch("join_coverage_mappings.subprocess.run", side_effect=FileNotFoundError):
+        assert jcm.demangle_function_ids(mapping) == {"src/a.cpp:_Z3barv:3": {"t1"}}
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "c++filt failed" in captured.err
+    assert "c++filt not found" in captured.err
+
+
+def test_ids_with_same_demangled_name_are_merged(capsys):
+    """Complete and base constructors share a demangled name; their tests are unioned."""
+    mapping = {
+        "src/foo.cpp:_ZN3FooC1Ev:5": ["t1", "t2"],
+        "src/foo.cpp:_ZN3FooC2Ev:5": ["t2", "t3"],
+    }
+    with patch("join_coverage_mappings.subprocess.run", side_effect=_fake_cxxfilt):
+        result = jcm.demangle_function_ids(mapping)
+
+    assert result == {"src/foo.cpp:Foo::Foo():5": {"t1", "t2", "t3"}}
+    assert "1 function id(s) merged" in capsys.readouterr().err
@@ -0,0 +1,32 @@
+"""Unit tests for schedule selection in s3_state."""
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts/scheduling"))
+
+# s3_state exits at import time without boto3
+pytest.importorskip("boto3")
+
+from s3_state import find_least_fuzzed
+
+
+def test_empty_schedule():
+    assert find_least_fuzzed([]) is None
+
+
+def test_picks_lowest_fuzz_count():
+    schedule = [{"hash": "a", "fuzz_count": 3}, {"hash": "b", "fuzz_count": 1}, {"hash": "c", "fuzz_count": 2}]
+    assert find_least_fuzzed(schedule)["hash"] == "b"
+
+
+def test_ties_go_to_the_oldest_entry():
+    schedule = [{"hash": "a", "fuzz_count": 2}, {"hash": "b", "fuzz_count": 1}, {"hash": "c", "fuzz_count": 1}]
+    assert find_least_fuzzed(schedule)["hash"] == "b"
+
+
+def test_missing_fuzz_count_counts_as_unfuzzed():
+    schedule = [{"hash": "a", "fuzz_count": 1}, {"hash": "b"}, {"hash": "c", "fuzz_count": 0}]
+    assert find_least_fuzzed(schedule)["hash"] == "b"
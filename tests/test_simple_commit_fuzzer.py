@@ -0,0 +1,103 @@
+"""Unit tests for work claiming, CPU pinning and bug consolidation in SimpleCommitFuzzer."""
+import re
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts/commit_fuzzer"))
+
+from simple_commit_fuzzer import MP_CONTEXT, SimpleCommitFuzzer
+
+
+def make_fuzzer(**attrs):
+    """A SimpleCommitFuzzer with only the given attributes set; skips config loading."""
+    fuzzer = object.__new__(SimpleCommitFuzzer)
+    fuzzer.__dict__.update(attrs)
+    return fuzzer
+
+
+def test_claim_batch_hands_out_each_test_once():
+    tests = tuple(f"t{i}.smt2" for i in range(10))
+    fuzzer = make_fuzzer(tests=tests, _test_cursor=MP_CONTEXT.Value('i', 0))
+
+    assert fuzzer._claim_batch(4) == tests[:4]
+    assert fuzzer._claim_batch(4) == tests[4:8]
+    assert fuzzer._claim_batch(4) == tests[8:]
+    assert fuzzer._claim_batch(4) == ()
+
+
+def test_claim_batch_concurrent_claims_do_not_overlap():
+    tests = tuple(f"t{i}.smt2" for i in range(1000))
+    fuzzer = make_fuzzer(tests=tests, _test_cursor=MP_CONTEXT.Value('i', 0))
+    claimed = []
+
+    def worker():
+        while True:
+            batch = fuzzer._claim_batch(7)
+            if not batch:
+                return
+            claimed.extend(batch)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(claimed) == sorted(tests)
+
+
+def _cpu_map(cpus, num_workers, siblings=None):
+    """Build the worker CPU map for the given affinity and thread_siblings_list contents."""
+    def read_text(path):
+        cpu = int(re.search(r"cpu(\d+)/topology", str(path)).group(1))
+        if siblings is None:
+            raise FileNotFoundError(path)
+        return siblings[cpu]
+
+    fuzzer = make_fuzzer(num_workers=num_workers)
+    with patch("os.sched_getaffinity", return_value=set(cpus), create=True), \
+         patch.object(Path, "read_text", read_text):
+        return fuzzer._build_worker_cpu_map()
+
+
+def test_cpu_map_spreads_remainder_without_topology():
+    assert _cpu_map(range(6), 4) == {1: [0], 2: [1, 2], 3: [3], 4: [4, 5]}
+
+
+def test_cpu_map_keeps_hyperthread_siblings_together():
+    siblings = {0: "0,4", 1: "1,5", 2: "2,6", 3: "3,7", 4: "0,4", 5: "1,5", 6: "2,6", 7: "3,7"}
+    assert _cpu_map(range(8), 2, siblings) == {1: [0, 4, 1, 5], 2: [2, 6, 3, 7]}
+
+
+def test_cpu_map_splits_logical_cpus_when_cores_are_short():
+    siblings = {0: "0-1", 1: "0-1", 2: "2-3", 3: "2-3"}
+    assert _cpu_map(range(4), 4, siblings) == {1: [0], 2: [1], 3: [2], 4: [3]}
+
+
+def test_cpu_map_shares_cpus_when_workers_outnumber_them():
+    assert _cpu_map(range(2), 3) == {1: [0], 2: [1], 3: [0]}
+
+
+def test_consolidate_subdir_renames_name_collisions(tmp_path):
+    bugs = tmp_path / "bugs"
+    (bugs / "worker_1").mkdir(parents=True)
+    (bugs / "worker_2").mkdir()
+    (bugs / "crash.smt2").write_text("root")
+    (bugs / "worker_1" / "crash.smt2").write_text("w1")
+    (bugs / "worker_2" / "crash.smt2").write_text("w2")
+    (bugs / "worker_2" / "notes.txt").write_text("not a bug")
+
+    fuzzer = make_fuzzer(bugs_folder=bugs, _bug_re=re.compile(r".*\.smt2\Z"))
+    taken = {"crash.smt2"}
+    lock = threading.Lock()
+    with patch("simple_commit_fuzzer.time.time", return_value=1700000000):
+        moved = (fuzzer._consolidate_subdir(bugs / "worker_1", taken, lock)
+                 + fuzzer._consolidate_subdir(bugs / "worker_2", taken, lock))
+
+    assert [p.name for p in moved] == ["crash_1700000000_0.smt2", "crash_1700000000_1.smt2"]
+    assert [p.read_text() for p in moved] == ["w1", "w2"]
+    assert (bugs / "crash.smt2").read_text() == "root"
+    assert (bugs / "worker_2" / "notes.txt").exists()
+    assert taken == {"crash.smt2", "crash_1700000000_0.smt2", "crash_1700000000_1.smt2"}